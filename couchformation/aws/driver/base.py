@@ -10,6 +10,7 @@ import os
 import webbrowser
 import time
 import configparser
+from typing import Callable, List
 from pathlib import Path
 from datetime import datetime, timezone
 from couchformation.exception import FatalError, NonFatalError
@@ -279,6 +280,30 @@ class CloudBase(object):
                 return tags[i]['Value']
         return None
 
+    @staticmethod
+    def describe_by_filter(describe: Callable, key: str, name: str, values: List[str]) -> List[dict]:
+        items = []
+        extra_args = {}
+        id_filter = {
+            'Name': name,
+            'Values': values
+        }
+
+        if len(values) == 0:
+            return items
+
+        try:
+            while True:
+                result = describe(**extra_args, Filters=[id_filter])
+                items.extend(result.get(key, []))
+                if 'NextToken' not in result:
+                    break
+                extra_args['NextToken'] = result['NextToken']
+        except Exception as err:
+            raise AWSDriverError(f"error getting {key} list: {err}")
+
+        return items
+
     def get_all_regions(self) -> list:
         regions = self.ec2_client.describe_regions(AllRegions=False)
         region_list = list(r['RegionName'] for r in regions['Regions'])
@@ -2,7 +2,9 @@
 ##
 
 import logging
+import threading
 import botocore.exceptions
+from typing import List, Tuple
 from couchformation.aws.driver.base import CloudBase, AWSDriverError
 
 logger = logging.getLogger('couchformation.aws.driver.dns')
@@ -12,6 +14,8 @@ logging.getLogger("urllib3").setLevel(logging.ERROR)
 
 
 class DNS(CloudBase):
+    _zone_cache = {}
+    _zone_lock = threading.Lock()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -48,11 +52,18 @@ class DNS(CloudBase):
             raise AWSDriverError(f"error: {err}")
 
     def zone_id(self, domain: str):
+        with DNS._zone_lock:
+            if domain in DNS._zone_cache:
+                return DNS._zone_cache[domain]
         try:
             result = self.dns_client.list_hosted_zones()
             r_set = next((item for item in result.get('HostedZones', [])
                           if item.get('Name').startswith(domain) and item.get('Config', {}).get('PrivateZone', False) is False), None)
-            return r_set.get('Id') if r_set else None
+            zone_id = r_set.get('Id') if r_set else None
+            if zone_id:
+                with DNS._zone_lock:
+                    DNS._zone_cache[domain] = zone_id
+            return zone_id
         except botocore.exceptions.ClientError as err:
             if err.response['Error']['Code'] == 'NoSuchHostedZone':
                 return None
@@ -80,48 +91,57 @@ class DNS(CloudBase):
             raise AWSDriverError(f"error deleting hosted domain: {err}")
 
     def add_record(self, hosted_zone: str, name: str, values: list, record_type: str = 'A', ttl: int = 300):
-        change_batch = {
-            'Changes': [
-                {
-                    'Action': 'CREATE',
-                    'ResourceRecordSet': {
-                        'Name': name,
-                        'Type': record_type,
-                        'TTL': ttl,
-                        'ResourceRecords': []
-                    }
-                }
-            ]
-        }
-        for item in values:
-            change_batch['Changes'][0]['ResourceRecordSet']['ResourceRecords'].append({'Value': item})
+        return self.add_records(hosted_zone, [(name, values)], record_type, ttl)
+
+    def delete_record(self, hosted_zone: str, name: str, values: list, record_type: str = 'A', ttl: int = 300):
+        return self.delete_records(hosted_zone, [(name, values)], record_type, ttl)
+
+    def add_records(self, hosted_zone: str, records: List[Tuple[str, list]], record_type: str = 'A', ttl: int = 300):
+        change_batch = self.change_batch('CREATE', records, record_type, ttl)
         try:
             result = self.dns_client.change_resource_record_sets(HostedZoneId=hosted_zone, ChangeBatch=change_batch)
             return result.get('ChangeInfo', {}).get('Status')
         except Exception as err:
             raise AWSDriverError(f"error adding record to domain: {err}")
 
-    def delete_record(self, hosted_zone: str, name: str, values: list, record_type: str = 'A', ttl: int = 300):
+    def delete_records(self, hosted_zone: str, records: List[Tuple[str, list]], record_type: str = 'A', ttl: int = 300):
+        change_batch = self.change_batch('DELETE', records, record_type, ttl)
+        try:
+            result = self.dns_client.change_resource_record_sets(HostedZoneId=hosted_zone, ChangeBatch=change_batch)
+            return result.get('ChangeInfo', {}).get('Status')
+        except botocore.exceptions.ClientError as err:
+            if err.response['Error']['Code'] != 'InvalidChangeBatch':
+                raise AWSDriverError(f"error deleting record from domain: {err}")
+            if len(records) > 1:
+                logger.warning(f"Record batch rejected by zone {hosted_zone}, deleting records individually")
+                for record in records:
+                    self.delete_records(hosted_zone, [record], record_type, ttl)
+                return None
+            if 'not found' not in err.response['Error'].get('Message', ''):
+                raise AWSDriverError(f"error deleting record from domain: {err}")
+            logger.warning(f"Record {records[0][0]} not found in zone {hosted_zone}")
+            return None
+        except Exception as err:
+            raise AWSDriverError(f"error deleting record from domain: {err}")
+
+    @staticmethod
+    def change_batch(action: str, records: List[Tuple[str, list]], record_type: str = 'A', ttl: int = 300) -> dict:
         change_batch = {
-            'Changes': [
+            'Changes': []
+        }
+        for name, values in records:
+            change_batch['Changes'].append(
                 {
-                    'Action': 'DELETE',
+                    'Action': action,
                     'ResourceRecordSet': {
                         'Name': name,
                         'Type': record_type,
                         'TTL': ttl,
-                        'ResourceRecords': []
+                        'ResourceRecords': [{'Value': item} for item in values]
                     }
                 }
-            ]
-        }
-        for item in values:
-            change_batch['Changes'][0]['ResourceRecordSet']['ResourceRecords'].append({'Value': item})
-        try:
-            result = self.dns_client.change_resource_record_sets(HostedZoneId=hosted_zone, ChangeBatch=change_batch)
-            return result.get('ChangeInfo', {}).get('Status')
-        except Exception as err:
-            raise AWSDriverError(f"error deleting record from domain: {err}")
+            )
+        return change_batch
 
     def list_associations(self, vpc_id: str, region: str):
         extra_args = {}
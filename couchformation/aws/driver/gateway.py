@@ -105,3 +105,15 @@ class InternetGateway(CloudBase):
             raise AWSDriverError(f"ClientError: {err}")
         except Exception as err:
             raise AWSDriverError(f"error getting Internet Gateway details: {err}")
+
+    def list_by_id(self, ig_ids: List[str]) -> List[dict]:
+        ig_list = []
+        igs = self.describe_by_filter(self.ec2_client.describe_internet_gateways, 'InternetGateways', 'internet-gateway-id', ig_ids)
+
+        for ig_entry in igs:
+            ig_block = {'owner': ig_entry['OwnerId'],
+                        'attachments': [a['VpcId'] for a in ig_entry['Attachments']],
+                        'id': ig_entry['InternetGatewayId']}
+            ig_list.append(ig_block)
+
+        return ig_list
@@ -5,9 +5,10 @@ import base64
 import logging
 import re
 import time
+import threading
 import botocore.exceptions
 from datetime import datetime, timezone
-from typing import Union, List
+from typing import Union, List, Callable
 
 from couchformation.aws.driver.base import CloudBase, AWSDriverError
 from couchformation.aws.driver.constants import AWSEbsDisk, AWSEphemeralDisk, AWSTagStruct, EbsVolume, AWSTag, PlacementType
@@ -34,24 +35,27 @@ class Instance(CloudBase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def run(self,
-            name: str,
-            ami: str,
-            ssh_key: str,
-            sg_list: Union[str, List[str]],
-            subnet: str,
-            zone: str,
-            root_size=256,
-            swap_size=16,
-            swap_iops=3000,
-            data_size=256,
-            data_iops=3000,
-            instance_type="t2.micro",
-            placement: PlacementType = PlacementType.ZONE,
-            host_id: str = None,
-            enable_winrm: bool = False,
-            tags: dict = None,
-            ephemeral: bool = False):
+    def run(self, name: str, *args, **kwargs) -> str:
+        return self.run_batch([name], *args, **kwargs)[0]
+
+    def run_batch(self,
+                  names: List[str],
+                  ami: str,
+                  ssh_key: str,
+                  sg_list: Union[str, List[str]],
+                  subnet: str,
+                  zone: str,
+                  root_size=256,
+                  swap_size=16,
+                  swap_iops=3000,
+                  data_size=256,
+                  data_iops=3000,
+                  instance_type="t2.micro",
+                  placement: PlacementType = PlacementType.ZONE,
+                  host_id: str = None,
+                  enable_winrm: bool = False,
+                  tags: dict = None,
+                  ephemeral: bool = False) -> List[str]:
         volume_type = "gp3"
         kwargs = {}
         try:
@@ -72,8 +76,10 @@ class Instance(CloudBase):
             disk_list.append(AWSEphemeralDisk.build(f"{root_disk_prefix}c", "ephemeral0").as_dict)
         else:
             disk_list.append(AWSEbsDisk.build(f"{root_disk_prefix}c", EbsVolume(volume_type, data_size, data_iops)).as_dict)
+        count = len(names)
         i_tag = AWSTagStruct.build("instance")
-        i_tag.add(AWSTag("Name", name))
+        if count == 1:
+            i_tag.add(AWSTag("Name", names[0]))
         if tags:
             for k, v in tags.items():
                 i_tag.add(AWSTag(k, str(v)))
@@ -98,8 +104,8 @@ class Instance(CloudBase):
                                                    ImageId=ami,
                                                    InstanceType=instance_type,
                                                    KeyName=ssh_key,
-                                                   MaxCount=1,
-                                                   MinCount=1,
+                                                   MaxCount=count,
+                                                   MinCount=count,
                                                    SecurityGroupIds=security_groups,
                                                    SubnetId=subnet,
                                                    Placement=placement,
@@ -120,11 +126,23 @@ class Instance(CloudBase):
         except Exception as err:
             raise AWSDriverError(f"error running instance: {err}")
 
-        instance_id = result['Instances'][0]['InstanceId']
+        instance_ids = [i['InstanceId'] for i in sorted(result['Instances'], key=lambda i: i.get('AmiLaunchIndex', 0))]
+
+        if count > 1:
+            try:
+                for instance_id, name in zip(instance_ids, names):
+                    self.ec2_client.create_tags(Resources=[instance_id], Tags=[AWSTag("Name", name).as_dict])
+            except Exception as err:
+                raise AWSDriverError(f"error tagging instances: {err}")
+
         waiter = self.ec2_client.get_waiter('instance_running')
-        waiter.wait(InstanceIds=[instance_id])
+        waiter.wait(InstanceIds=instance_ids)
 
-        return instance_id
+        return instance_ids
+
+    def list_by_id(self, instance_ids: List[str]) -> List[dict]:
+        reservations = self.describe_by_filter(self.ec2_client.describe_instances, 'Reservations', 'instance-id', instance_ids)
+        return [instance for reservation in reservations for instance in reservation.get('Instances', [])]
 
     def list(self):
         instances = []
@@ -251,16 +269,131 @@ class Instance(CloudBase):
 
         return result['Images'][0]
 
+    def password_data(self, instance_id: str) -> Union[str, None]:
+        try:
+            result = self.ec2_client.get_password_data(InstanceId=instance_id)
+            return result.get('PasswordData') if result.get('PasswordData') else None
+        except Exception as err:
+            raise AWSDriverError(f"error getting instance password: {err}")
+
     def get_password(self, instance_id: str, ssh_key: str) -> str:
+        logger.info(f"Waiting for instance {instance_id} password")
+        encrypted_password = InstanceWatcher.get(self.parameters).wait_for_password(instance_id)
         try:
-            logger.info(f"Waiting for instance {instance_id} password")
-            while True:
-                result = self.ec2_client.get_password_data(InstanceId=instance_id)
-                encrypted_password = result.get('PasswordData')
-                if not encrypted_password:
-                    time.sleep(5)
-                    continue
-                password_data = base64.b64decode(encrypted_password)
-                return SSHUtil().decrypt_with_key(password_data, ssh_key)
+            password_data = base64.b64decode(encrypted_password)
+            return SSHUtil().decrypt_with_key(password_data, ssh_key)
         except Exception as err:
             raise AWSDriverError(f"error getting instance password: {err}")
+
+
+class InstanceWatcher(object):
+    """Process wide poller that serves all node threads waiting on instance data in a region.
+
+    Each poll interval issues one describe call covering every pending instance. EC2 has no bulk
+    password API, so Windows password data is fetched per instance, but from the same poll loop.
+    """
+    _watchers = {}
+    _lock = threading.Lock()
+
+    def __init__(self, parameters: dict, interval: float = 2.0, max_errors: int = 5, timeout: float = 1800.0):
+        self.parameters = parameters
+        self.interval = interval
+        self.max_errors = max_errors
+        self.timeout = timeout
+        self.pending = {}
+        self.passwords = {}
+        self.cond = threading.Condition()
+        self.thread = None
+
+    @classmethod
+    def get(cls, parameters: dict) -> 'InstanceWatcher':
+        key = (parameters.get('region'), parameters.get('profile'), parameters.get('auth_mode'))
+        with cls._lock:
+            if key not in cls._watchers:
+                cls._watchers[key] = cls(parameters)
+            return cls._watchers[key]
+
+    def wait_for(self, instance_id: str, check: Callable[[dict], bool]) -> dict:
+        return self._wait(self.pending, instance_id, check)
+
+    def wait_for_password(self, instance_id: str) -> str:
+        return self._wait(self.passwords, instance_id, None)
+
+    def _wait(self, queue: dict, instance_id: str, check: Union[Callable[[dict], bool], None]):
+        entry = {'check': check, 'result': None, 'error': None, 'done': False}
+        end = time.time() + self.timeout
+        with self.cond:
+            queue[instance_id] = entry
+            if not self.thread or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.poll, daemon=True)
+                self.thread.start()
+            while not entry['done']:
+                remaining = end - time.time()
+                if remaining <= 0:
+                    if queue.get(instance_id) is entry:
+                        del queue[instance_id]
+                    break
+                self.cond.wait(remaining)
+        if not entry['done']:
+            raise AWSDriverError(f"timeout waiting for instance {instance_id}")
+        if isinstance(entry['error'], SystemExit):
+            raise SystemExit(entry['error'].code)
+        elif entry['error']:
+            raise AWSDriverError(f"error waiting for instance {instance_id}: {entry['error']}")
+        return entry['result']
+
+    def fail(self, err: BaseException):
+        with self.cond:
+            for queue in (self.pending, self.passwords):
+                for entry in queue.values():
+                    entry['error'] = err
+                    entry['done'] = True
+                queue.clear()
+            self.thread = None
+            self.cond.notify_all()
+
+    def poll(self):
+        errors = 0
+        try:
+            driver = Instance(self.parameters)
+        except BaseException as err:
+            self.fail(err)
+            return
+        while True:
+            with self.cond:
+                pending = dict(self.pending)
+                passwords = dict(self.passwords)
+                if not pending and not passwords:
+                    self.thread = None
+                    return
+
+            completed = {}
+            try:
+                for instance in driver.list_by_id(list(pending.keys())):
+                    instance_id = instance['InstanceId']
+                    if pending[instance_id]['check'](instance):
+                        completed[instance_id] = (self.pending, instance)
+                for instance_id in passwords:
+                    password = driver.password_data(instance_id)
+                    if password:
+                        completed[instance_id] = (self.passwords, password)
+                errors = 0
+            except Exception as err:
+                errors += 1
+                logger.debug(f"Instance watcher poll error ({errors}): {err}")
+                if errors >= self.max_errors:
+                    self.fail(err)
+                    return
+            except BaseException as err:
+                self.fail(err)
+                return
+
+            with self.cond:
+                for instance_id, (queue, result) in completed.items():
+                    entry = queue.pop(instance_id, None)
+                    if entry:
+                        entry['result'] = result
+                        entry['done'] = True
+                self.cond.notify_all()
+
+            time.sleep(self.interval)
@@ -100,6 +100,18 @@ class Network(CloudBase):
         except Exception as err:
             raise AWSDriverError(f"error getting VPC details: {err}")
 
+    def list_by_id(self, vpc_ids: List[str]) -> List[dict]:
+        vpc_list = []
+        vpcs = self.describe_by_filter(self.ec2_client.describe_vpcs, 'Vpcs', 'vpc-id', vpc_ids)
+
+        for vpc_entry in vpcs:
+            vpc_block = {'cidr': vpc_entry['CidrBlock'],
+                         'default': vpc_entry['IsDefault'],
+                         'id': vpc_entry['VpcId']}
+            vpc_list.append(vpc_block)
+
+        return vpc_list
+
     def peering_details(self, vpc_id: str) -> Union[List[dict], None]:
         extra_args = {}
         peers = []
@@ -263,6 +275,21 @@ class Subnet(CloudBase):
         except Exception as err:
             raise AWSDriverError(f"error getting VPC details: {err}")
 
+    def list_by_id(self, subnet_ids: List[str]) -> List[dict]:
+        subnet_list = []
+        subnets = self.describe_by_filter(self.ec2_client.describe_subnets, 'Subnets', 'subnet-id', subnet_ids)
+
+        for subnet in subnets:
+            net_block = {'cidr': subnet['CidrBlock'],
+                         'name': subnet['SubnetId'],
+                         'vpc': subnet['VpcId'],
+                         'zone': subnet['AvailabilityZone'],
+                         'default': subnet['DefaultForAz'],
+                         'public': subnet['MapPublicIpOnLaunch']}
+            subnet_list.append(net_block)
+
+        return subnet_list
+
     def delete(self, subnet_id: str) -> None:
         try:
             self.ec2_client.delete_subnet(SubnetId=subnet_id)
@@ -3,7 +3,7 @@
 
 import logging
 import botocore.exceptions
-from typing import Union, List
+from typing import Union, List, Tuple
 from couchformation.aws.driver.base import CloudBase, AWSDriverError, EmptyResultSet
 from couchformation.aws.driver.constants import AWSTagStruct, AWSTag
 
@@ -87,20 +87,26 @@ class SecurityGroup(CloudBase):
         return result['Return']
 
     def add_ingress(self, sg_id: str, protocol: str, from_port: int, to_port: int, cidr: str):
+        return self.add_ingress_rules(sg_id, [(protocol, from_port, to_port, cidr)])
+
+    def add_ingress_rules(self, sg_id: str, rules: List[Tuple[str, int, int, str]]):
+        if len(rules) == 0:
+            return True
+        ip_permissions = [{
+            'IpProtocol': protocol,
+            'FromPort': from_port,
+            'ToPort': to_port,
+            'IpRanges': [{
+                'CidrIp': cidr
+            }],
+        } for protocol, from_port, to_port, cidr in rules]
         try:
             result = self.ec2_client.authorize_security_group_ingress(
                 GroupId=sg_id,
-                IpPermissions=[{
-                    'IpProtocol': protocol,
-                    'FromPort': from_port,
-                    'ToPort': to_port,
-                    'IpRanges': [{
-                        'CidrIp': cidr
-                    }],
-                }]
+                IpPermissions=ip_permissions
             )
         except Exception as err:
-            raise AWSDriverError(f"error adding egress to security group: {err}")
+            raise AWSDriverError(f"error adding ingress to security group: {err}")
 
         return result['Return']
 
@@ -168,3 +174,16 @@ class SecurityGroup(CloudBase):
             raise AWSDriverError(f"ClientError: {err}")
         except Exception as err:
             raise AWSDriverError(f"error getting security group details: {err}")
+
+    def list_by_id(self, sg_ids: List[str]) -> List[dict]:
+        sg_list = []
+        sgs = self.describe_by_filter(self.ec2_client.describe_security_groups, 'SecurityGroups', 'group-id', sg_ids)
+
+        for sg_entry in sgs:
+            sg_block = {'name': sg_entry['GroupName'],
+                        'description': sg_entry['Description'],
+                        'id': sg_entry['GroupId'],
+                        'vpc': sg_entry['VpcId']}
+            sg_list.append(sg_block)
+
+        return sg_list
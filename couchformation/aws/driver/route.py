@@ -106,6 +106,20 @@ class RouteTable(CloudBase):
         except Exception as err:
             raise AWSDriverError(f"error getting Route Table details: {err}")
 
+    def list_by_id(self, rt_ids: List[str]) -> List[dict]:
+        table_list = []
+        tables = self.describe_by_filter(self.ec2_client.describe_route_tables, 'RouteTables', 'route-table-id', rt_ids)
+
+        for table_entry in tables:
+            table_block = {'owner': table_entry['OwnerId'],
+                           'associations': [a for a in table_entry['Associations']],
+                           'routes': [r for r in table_entry['Routes']],
+                           'vpc': table_entry['VpcId'],
+                           'id': table_entry['RouteTableId']}
+            table_list.append(table_block)
+
+        return table_list
+
     def associate(self, rt_id: str, subnet_id: str):
         try:
             response = self.ec2_client.associate_route_table(RouteTableId=rt_id, SubnetId=subnet_id)
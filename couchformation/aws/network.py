@@ -6,7 +6,7 @@ import logging
 import random
 import string
 from itertools import cycle
-from typing import List
+from typing import List, Tuple
 from couchformation.network import NetworkDriver
 from couchformation.aws.driver.network import Network, Subnet
 from couchformation.aws.driver.sshkey import SSHKey
@@ -83,81 +83,62 @@ class AWSNetwork(object):
         self.key_name = f"{self.asset_prefix}-key"
 
     def check_state(self):
-        for n, zone_state in reversed(list(enumerate(self.state.list_get('zone')))):
+        subnet_driver = Subnet(self.parameters)
+        rt_driver = RouteTable(self.parameters)
+        ig_driver = InternetGateway(self.parameters)
+        sg_driver = SecurityGroup(self.parameters)
+
+        zone_list = self.state.list_get('zone')
+        subnet_found = [s['name'] for s in subnet_driver.list_by_id([z[2] for z in zone_list])]
+        for n, zone_state in reversed(list(enumerate(zone_list))):
             subnet_id = zone_state[2]
-            result = Subnet(self.parameters).details(subnet_id)
-            if result is None:
+            if subnet_id not in subnet_found:
                 logger.warning(f"Removing stale state entry for subnet {subnet_id}")
                 self.state.list_remove('zone', zone_state[0])
 
         if self.state.get('route_table_id'):
-            result = RouteTable(self.parameters).details(self.state['route_table_id'])
-            if result is None:
+            rt_found = [r['id'] for r in rt_driver.list_by_id([self.state['route_table_id']])]
+            if self.state['route_table_id'] not in rt_found:
                 logger.warning(f"Removing stale state entry for route table {self.state['route_table_id']}")
                 del self.state['route_table_id']
         else:
-            result = RouteTable(self.parameters).get(self.rt_name)
+            result = rt_driver.get(self.rt_name)
             if result:
                 logger.warning(f"Importing orphaned entry for route table {result}")
                 self.state['route_table_id'] = result
 
         if self.state.get('internet_gateway_id'):
-            result = InternetGateway(self.parameters).details(self.state['internet_gateway_id'])
-            if result is None:
+            ig_found = [i['id'] for i in ig_driver.list_by_id([self.state['internet_gateway_id']])]
+            if self.state['internet_gateway_id'] not in ig_found:
                 logger.warning(f"Removing stale state entry for gateway {self.state['internet_gateway_id']}")
                 del self.state['internet_gateway_id']
         else:
-            result = InternetGateway(self.parameters).get(self.ig_name)
+            result = ig_driver.get(self.ig_name)
             if result:
                 logger.warning(f"Importing orphaned entry for internet gateway {result}")
                 self.state['internet_gateway_id'] = result
 
-        if self.state.get('security_group_id'):
-            result = SecurityGroup(self.parameters).details(self.state['security_group_id'])
-            if result is None:
-                logger.warning(f"Removing stale state entry for security group {self.state['security_group_id']}")
-                del self.state['security_group_id']
-        else:
-            result = SecurityGroup(self.parameters).get(self.sg_name)
-            if result:
-                logger.warning(f"Importing orphaned entry for security group {result}")
-                self.state['security_group_id'] = result
+        build_sg_keys = {f"{c.build}_security_group_id": f"{self.asset_prefix}-{c.build}-sg" for c in self.build_ports}
+        sg_keys = {'security_group_id': self.sg_name, 'win_security_group_id': f"{self.asset_prefix}-win-sg"}
+        sg_keys.update(build_sg_keys)
+        sg_keys.update({k: None for k in self.state.key_match('.*_group_.*_sg_id')})
 
-        for build_port_cfg in self.build_ports:
-            build_name = build_port_cfg.build
-            state_key_name = f"{build_name}_security_group_id"
-            build_sg_name = f"{self.asset_prefix}-{build_name}-sg"
+        sg_state_ids = [self.state[k] for k in sg_keys if self.state.get(k)]
+        sg_found = [g['id'] for g in sg_driver.list_by_id(sg_state_ids)]
+        sg_search = sg_driver.search(f"{self.asset_prefix}-*") or []
+        sg_by_name = {g.get('Name'): g.get('id') for g in sg_search}
+
+        for state_key_name, sg_name in sg_keys.items():
             if self.state.get(state_key_name):
-                result = SecurityGroup(self.parameters).details(self.state[state_key_name])
-                if result is None:
+                if self.state[state_key_name] not in sg_found:
                     logger.warning(f"Removing stale state entry for security group {self.state[state_key_name]}")
                     del self.state[state_key_name]
-            else:
-                result = SecurityGroup(self.parameters).get(build_sg_name)
-                if result:
-                    logger.warning(f"Importing orphaned entry for security group {result}")
-                    self.state[state_key_name] = result
-
-        if self.state.get('win_security_group_id'):
-            result = SecurityGroup(self.parameters).details(self.state['win_security_group_id'])
-            if result is None:
-                logger.warning(f"Removing stale state entry for security group {self.state['win_security_group_id']}")
-                del self.state['win_security_group_id']
-        else:
-            win_sg_name = f"{self.asset_prefix}-win-sg"
-            result = SecurityGroup(self.parameters).get(win_sg_name)
-            if result:
+            elif sg_name and sg_by_name.get(sg_name):
+                result = sg_by_name.get(sg_name)
                 logger.warning(f"Importing orphaned entry for security group {result}")
-                self.state['win_security_group_id'] = result
-
-        for group_sg_key in self.state.key_match('.*_group_.*_sg_id'):
-            if self.state.get(group_sg_key):
-                result = SecurityGroup(self.parameters).details(self.state[group_sg_key])
-                if result is None:
-                    logger.warning(f"Removing stale state entry for security group {self.state[group_sg_key]}")
-                    del self.state[group_sg_key]
+                self.state[state_key_name] = result
 
-        for n, sg_group in enumerate(SecurityGroup(self.parameters).search(f"{self.asset_prefix}-*-sg")):
+        for n, sg_group in enumerate(g for g in sg_search if g.get('Name', '').endswith('-sg') and g.get('Name') != self.sg_name):
             sg_group_id = sg_group.get('id')
             service = sg_group.get('Service', 'import')
             group = sg_group.get('Group', n)
@@ -167,8 +148,8 @@ class AWSNetwork(object):
                 self.state[state_key_name] = sg_group_id
 
         if self.state.get('vpc_id'):
-            result = Network(self.parameters).details(self.state['vpc_id'])
-            if result is None:
+            vpc_found = [v['id'] for v in self.aws_network.list_by_id([self.state['vpc_id']])]
+            if self.state['vpc_id'] not in vpc_found:
                 logger.warning(f"Removing stale state entry for network {self.state['vpc_id']}")
                 del self.state['vpc_id']
                 del self.state['vpc_cidr']
@@ -233,8 +214,7 @@ class AWSNetwork(object):
                                                               f"Couch Formation project {self.project}",
                                                               vpc_id,
                                                               parameter_to_dict(self.tags))
-                SecurityGroup(self.parameters).add_ingress(sg_id, "-1", 0, 0, vpc_cidr)
-                SecurityGroup(self.parameters).add_ingress(sg_id, "tcp", 22, 22, self.allow)
+                SecurityGroup(self.parameters).add_ingress_rules(sg_id, [("-1", 0, 0, vpc_cidr), ("tcp", 22, 22, self.allow)])
                 self.state['security_group_id'] = sg_id
                 logger.info(f"Created security group {sg_id}")
 
@@ -317,10 +297,7 @@ class AWSNetwork(object):
             build_sg_name = f"{self.asset_prefix}-{build_name}-sg"
             if not self.state.get(state_key_name):
                 build_sg_id = SecurityGroup(self.parameters).create(build_sg_name, f"Couch Formation build type {build_name}", vpc_id)
-                for begin, end in build_port_cfg.tcp_as_tuple():
-                    SecurityGroup(self.parameters).add_ingress(build_sg_id, "tcp", begin, end, self.allow)
-                for begin, end in build_port_cfg.udp_as_tuple():
-                    SecurityGroup(self.parameters).add_ingress(build_sg_id, "udp", begin, end, self.allow)
+                SecurityGroup(self.parameters).add_ingress_rules(build_sg_id, self.port_rules(build_port_cfg))
                 self.state[state_key_name] = build_sg_id
                 logger.info(f"Created {build_name} build security group {build_sg_id}")
             else:
@@ -333,8 +310,7 @@ class AWSNetwork(object):
         if not self.state.get('win_security_group_id'):
             win_sg_name = f"{self.asset_prefix}-win-sg"
             win_sg_id = SecurityGroup(self.parameters).create(win_sg_name, "Couch Formation Windows OS ports", vpc_id)
-            SecurityGroup(self.parameters).add_ingress(win_sg_id, "tcp", 3389, 3389, self.allow)
-            SecurityGroup(self.parameters).add_ingress(win_sg_id, "tcp", 5985, 5986, self.allow)
+            SecurityGroup(self.parameters).add_ingress_rules(win_sg_id, [("tcp", 3389, 3389, self.allow), ("tcp", 5985, 5986, self.allow)])
             self.state['win_security_group_id'] = win_sg_id
             logger.info(f"Created win security group {win_sg_id}")
         else:
@@ -351,16 +327,18 @@ class AWSNetwork(object):
             port_cfg = PortSettings().create(self.name, ports)
             tags = {'Service': service, 'Group': group}
             port_sg_id = SecurityGroup(self.parameters).create(build_sg_name, f"Couch Formation service {service} group {group}", vpc_id, tags=tags)
-            for begin, end in port_cfg.tcp_as_tuple():
-                SecurityGroup(self.parameters).add_ingress(port_sg_id, "tcp", begin, end, self.allow)
-            for begin, end in port_cfg.udp_as_tuple():
-                SecurityGroup(self.parameters).add_ingress(port_sg_id, "udp", begin, end, self.allow)
+            SecurityGroup(self.parameters).add_ingress_rules(port_sg_id, self.port_rules(port_cfg))
             self.state[state_key_name] = port_sg_id
             logger.info(f"Created service group security group {port_sg_id}")
         else:
             port_sg_id = self.state.get(state_key_name)
         return port_sg_id
 
+    def port_rules(self, port_cfg) -> List[Tuple[str, int, int, str]]:
+        rules = [("tcp", begin, end, self.allow) for begin, end in port_cfg.tcp_as_tuple()]
+        rules.extend([("udp", begin, end, self.allow) for begin, end in port_cfg.udp_as_tuple()])
+        return rules
+
     @synchronize()
     def peer_vpc(self):
         self.check_state()
@@ -3,18 +3,20 @@
 
 import os.path
 import re
+import json
 import logging
-import time
+from typing import List, Tuple
 from itertools import cycle, islice
 from couchformation.aws.driver.image import Image
 from couchformation.aws.driver.machine import MachineType
-from couchformation.aws.driver.instance import Instance
+from couchformation.aws.driver.instance import Instance, InstanceWatcher
 from couchformation.aws.driver.base import CloudBase
 from couchformation.aws.driver.constants import aws_storage_matrix, aws_arch_matrix, PlacementType
 from couchformation.aws.driver.dns import DNS
 from couchformation.aws.driver.nsg import SecurityGroup
 from couchformation.aws.network import AWSNetwork
 from couchformation.deployment import MetadataManager
+from couchformation.executor.batch import BatchRequest
 from couchformation.config import get_state_file, get_state_dir, PortSettingSet, State
 from couchformation.exception import FatalError
 from couchformation.kvdb import KeyValueStore
@@ -58,6 +60,7 @@ class AWSDeployment(object):
             else next((aws_storage_matrix[s] for s in aws_storage_matrix if s >= int(self.volume_size)), "3000")
         self.ephemeral = parameters.get('ephemeral') if parameters.get('ephemeral') else False
         self.services = parameters.get('services') if parameters.get('services') else "default"
+        self.quantity = int(parameters.get('quantity')) if parameters.get('quantity') else 1
 
         project_uid = MetadataManager(self.project).project_uid
         self.asset_prefix = f"cf-{project_uid}"
@@ -202,21 +205,22 @@ class AWSDeployment(object):
             enable_winrm = False
 
         logger.info(f"Creating node {self.node_name}")
-        instance_id = Instance(self.parameters).run(self.node_encoded,
-                                                    image['name'],
-                                                    ssh_key_name,
-                                                    nsg_list,
-                                                    subnet['subnet_id'],
-                                                    subnet['zone'],
-                                                    swap_size=machine_ram,
-                                                    data_size=volume_size,
-                                                    data_iops=volume_iops,
-                                                    instance_type=machine_name,
-                                                    placement=placement,
-                                                    host_id=host_id,
-                                                    enable_winrm=enable_winrm,
-                                                    tags=parameter_to_dict(self.tags),
-                                                    ephemeral=self.ephemeral)
+        launch_spec = dict(ami=image['name'],
+                           ssh_key=ssh_key_name,
+                           sg_list=nsg_list,
+                           subnet=subnet['subnet_id'],
+                           zone=subnet['zone'],
+                           swap_size=machine_ram,
+                           data_size=volume_size,
+                           data_iops=volume_iops,
+                           instance_type=machine_name,
+                           placement=placement,
+                           host_id=host_id,
+                           enable_winrm=enable_winrm,
+                           tags=parameter_to_dict(self.tags),
+                           ephemeral=self.ephemeral)
+        batch_key = (self.project, self.name, self.group, 'launch')
+        instance_id = BatchRequest.submit(batch_key, (self.node_encoded, launch_spec), self.launch_batch, expected=self.quantity)
 
         self.state['instance_id'] = instance_id
         self.state['name'] = self.node_encoded
@@ -224,24 +228,20 @@ class AWSDeployment(object):
         self.state['zone'] = subnet['zone']
         self.aws_network.add_service(self.node_name)
 
-        while True:
-            try:
-                instance_details = Instance(self.parameters).details(instance_id)
-                self.state['public_ip'] = instance_details['PublicIpAddress']
-                self.state['private_ip'] = instance_details['PrivateIpAddress']
-                break
-            except KeyError:
-                time.sleep(1)
+        instance_details = InstanceWatcher.get(self.parameters).wait_for(instance_id,
+                                                                       lambda i: 'PublicIpAddress' in i and 'PrivateIpAddress' in i)
+        self.state['public_ip'] = instance_details['PublicIpAddress']
+        self.state['private_ip'] = instance_details['PrivateIpAddress']
 
         if self.aws_network.public_zone and self.aws_network.domain_name and not self.state.get('public_hostname'):
             host_name = f"{self.node_name}.{self.aws_network.domain_name}"
-            DNS(self.parameters).add_record(self.aws_network.public_zone, host_name, [self.state['public_ip']])
+            self.dns_batch('add', self.aws_network.public_zone, host_name, [self.state['public_ip']])
             self.state['public_zone_id'] = self.aws_network.public_zone
             self.state['public_hostname'] = host_name
 
         if self.aws_network.private_zone and self.aws_network.domain_name and not self.state.get('private_hostname'):
             host_name = f"{self.node_name}.{self.aws_network.domain_name}"
-            DNS(self.parameters).add_record(self.aws_network.private_zone, host_name, [self.state['private_ip']])
+            self.dns_batch('add', self.aws_network.private_zone, host_name, [self.state['private_ip']])
             self.state['private_zone_id'] = self.aws_network.private_zone
             self.state['private_hostname'] = host_name
 
@@ -253,19 +253,47 @@ class AWSDeployment(object):
         self.state['state'] = State.DEPLOYED.value
         return self.state.as_dict
 
+    def launch_batch(self, requests: List[Tuple[str, dict]]) -> List[str]:
+        launch_sets = {}
+        for n, (name, launch_spec) in enumerate(requests):
+            spec_key = json.dumps(launch_spec, sort_keys=True, default=str)
+            launch_sets.setdefault(spec_key, []).append(n)
+
+        instance_ids = [None] * len(requests)
+        for index_list in launch_sets.values():
+            names = [requests[n][0] for n in index_list]
+            launch_spec = requests[index_list[0]][1]
+            logger.info(f"Launching {len(names)} instance(s) in subnet {launch_spec['subnet']}")
+            for n, instance_id in zip(index_list, Instance(self.parameters).run_batch(names, **launch_spec)):
+                instance_ids[n] = instance_id
+
+        return instance_ids
+
+    def dns_batch(self, action: str, hosted_zone: str, name: str, values: list):
+        def handler(records: List[Tuple[str, list]]):
+            logger.info(f"Submitting {len(records)} DNS record change(s) to zone {hosted_zone}")
+            if action == 'add':
+                DNS(self.parameters).add_records(hosted_zone, records)
+            else:
+                DNS(self.parameters).delete_records(hosted_zone, records)
+            return [True] * len(records)
+
+        batch_key = (self.project, self.name, self.group, 'dns', action, hosted_zone)
+        return BatchRequest.submit(batch_key, (name, values), handler, expected=self.quantity)
+
     def destroy(self):
         self.state['state'] = State.DESTROYING.value
         if self.state.get('public_hostname'):
             domain_id = self.state['public_zone_id']
             name = self.state['public_hostname']
             ip = self.state['public_ip']
-            DNS(self.parameters).delete_record(domain_id, name, [ip])
+            self.dns_batch('delete', domain_id, name, [ip])
             logger.info(f"Deleted DNS record for {ip}")
         if self.state.get('private_hostname'):
             domain_id = self.state['private_zone_id']
             name = self.state['private_hostname']
             ip = self.state['private_ip']
-            DNS(self.parameters).delete_record(domain_id, name, [ip])
+            self.dns_batch('delete', domain_id, name, [ip])
             logger.info(f"Deleted DNS record for {ip}")
         if self.state.get('instance_id'):
             instance_id = self.state['instance_id']
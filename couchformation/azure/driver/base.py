@@ -4,9 +4,12 @@
 import time
 import logging
 import os
+import threading
+import concurrent.futures
 import configparser
 from functools import wraps
 from typing import Union, List, Callable
+from azure.core.polling import LROPoller
 from azure.identity import AzureCliCredential
 from azure.mgmt.compute import ComputeManagementClient
 from azure.mgmt.network import NetworkManagementClient
@@ -52,11 +55,51 @@ class AzureDriverError(FatalError):
     pass
 
 
+class CachedCredential(object):
+    refresh_margin = 300
+
+    def __init__(self, credential):
+        self.credential = credential
+        self.tokens = {}
+        self.lock = threading.Lock()
+
+    def __getattr__(self, item):
+        return getattr(self.credential, item)
+
+    def cached_token(self, key: tuple, scopes: tuple, fetch: Callable):
+        with self.lock:
+            token = self.tokens.get(key)
+            if not token or token.expires_on - time.time() < self.refresh_margin:
+                logger.debug(f"Refreshing Azure token for scope {','.join(scopes)}")
+                token = fetch()
+                self.tokens[key] = token
+            return token
+
+    def get_token(self, *scopes, **kwargs):
+        if kwargs.get('claims'):
+            return self.credential.get_token(*scopes, **kwargs)
+        key = ('token', scopes, kwargs.get('tenant_id'), kwargs.get('enable_cae'))
+        return self.cached_token(key, scopes, lambda: self.credential.get_token(*scopes, **kwargs))
+
+    def get_token_info(self, *scopes, options=None):
+        options = options if options else {}
+        if not hasattr(self.credential, 'get_token_info'):
+            return self.get_token(*scopes, **options)
+        if options.get('claims'):
+            return self.credential.get_token_info(*scopes, options=options)
+        key = ('info', scopes, options.get('tenant_id'), options.get('enable_cae'))
+        return self.cached_token(key, scopes, lambda: self.credential.get_token_info(*scopes, options=options))
+
+
 class EmptyResultSet(NonFatalError):
     pass
 
 
 class CloudBase(object):
+    cache = {}
+    clients = {}
+    zone_cache = {}
+    cache_lock = threading.RLock()
 
     def __init__(self, parameters: dict):
         self.parameters = parameters
@@ -81,11 +124,12 @@ class CloudBase(object):
         if not self.credential or not self.azure_subscription_id:
             raise AzureDriverError("unauthorized (use az login)")
 
-        self.resource_client = ResourceManagementClient(self.credential, self.azure_subscription_id)
-        self.compute_client = ComputeManagementClient(self.credential, self.azure_subscription_id)
-        self.network_client = NetworkManagementClient(self.credential, self.azure_subscription_id)
-        self.dns_client = DnsManagementClient(self.credential, self.azure_subscription_id)
-        self.private_dns_client = PrivateDnsManagementClient(self.credential, self.azure_subscription_id)
+        self.subscription_client = self.cache.get('subscription_client')
+        self.resource_client = self.get_client(ResourceManagementClient)
+        self.compute_client = self.get_client(ComputeManagementClient)
+        self.network_client = self.get_client(NetworkManagementClient)
+        self.dns_client = self.get_client(DnsManagementClient)
+        self.private_dns_client = self.get_client(PrivateDnsManagementClient)
 
         self.azure_location = parameters.get('region')
 
@@ -93,15 +137,47 @@ class CloudBase(object):
 
     @auth_retry()
     def default_auth(self):
-        try:
-            credential = AzureCliCredential()
-            subscription_client = SubscriptionClient(credential)
-            subscriptions = subscription_client.subscriptions.list()
-            azure_subscription_id = next((s.subscription_id for s in subscriptions), None)
-            azure_tenant_id = credential.tenant_id
+        with CloudBase.cache_lock:
+            if CloudBase.cache.get('default_auth'):
+                return CloudBase.cache.get('default_auth')
+            try:
+                credential = CachedCredential(AzureCliCredential())
+                subscription_client = SubscriptionClient(credential)
+                subscriptions = subscription_client.subscriptions.list()
+                azure_subscription_id = next((s.subscription_id for s in subscriptions), None)
+                azure_tenant_id = credential.tenant_id
+            except Exception as err:
+                raise AzureDriverError(f"Azure: unauthorized (use az login): {err}")
+            if azure_subscription_id:
+                CloudBase.cache['default_auth'] = (credential, azure_subscription_id, azure_tenant_id)
+                CloudBase.cache['subscription_client'] = subscription_client
             return credential, azure_subscription_id, azure_tenant_id
+
+    def get_client(self, client_class):
+        key = (client_class.__name__, self.azure_subscription_id)
+        with CloudBase.cache_lock:
+            if key not in CloudBase.clients:
+                CloudBase.clients[key] = client_class(self.credential, self.azure_subscription_id)
+            return CloudBase.clients[key]
+
+    @staticmethod
+    def poller_result(poller: LROPoller, action: str):
+        try:
+            return poller.result()
         except Exception as err:
-            raise AzureDriverError(f"Azure: unauthorized (use az login): {err}")
+            raise AzureDriverError(f"error {action}: {err}")
+
+    @staticmethod
+    def run_parallel(tasks: List[Callable]) -> list:
+        if len(tasks) == 0:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(tasks), 16)) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            concurrent.futures.wait(futures)
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            raise AzureDriverError(f"{len(errors)} of {len(tasks)} operations failed: {errors[0]}")
+        return [future.result() for future in futures]
 
     def test_session(self):
         if len(self.azure_availability_zones) == 0:
@@ -159,6 +235,13 @@ class CloudBase(object):
                 self.azure_subscription_id = config[self.cloud_name].get('subscription', None)
 
     def zones(self) -> list:
+        zone_key = (self.azure_subscription_id, self.azure_location)
+        with CloudBase.cache_lock:
+            if CloudBase.zone_cache.get(zone_key):
+                self.azure_availability_zones = list(CloudBase.zone_cache[zone_key])
+                self.azure_zone = self.azure_availability_zones[0]
+                return self.azure_availability_zones
+
         zone_list = self.compute_client.resource_skus.list(filter=f"location eq '{self.azure_location}'")
         for group in list(zone_list):
             if group.resource_type == 'virtualMachines':
@@ -171,6 +254,9 @@ class CloudBase(object):
         if len(self.azure_availability_zones) == 0:
             raise AzureDriverError("can not get Azure availability zones")
 
+        with CloudBase.cache_lock:
+            CloudBase.zone_cache[zone_key] = list(self.azure_availability_zones)
+
         self.azure_zone = self.azure_availability_zones[0]
         return self.azure_availability_zones
 
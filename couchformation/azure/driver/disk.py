@@ -4,6 +4,7 @@
 import logging
 from typing import Union
 from azure.core.exceptions import ResourceNotFoundError
+from azure.core.polling import LROPoller
 from azure.mgmt.compute.models import DiskCreateOption
 from couchformation.azure.driver.base import CloudBase, AzureDriverError
 
@@ -20,6 +21,10 @@ class Disk(CloudBase):
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def create(self, resource_group: str, location: str, zone: str, size_value: Union[int, str], name: str, ultra: bool = False):
+        request = self.begin_create(resource_group, location, zone, size_value, name, ultra)
+        return self.poller_result(request, "creating disk")
+
+    def begin_create(self, resource_group: str, location: str, zone: str, size_value: Union[int, str], name: str, ultra: bool = False) -> LROPoller:
         size = int(size_value)
         disk_perf = self.disk_size_to_tier(size)
         parameters = {
@@ -38,9 +43,7 @@ class Disk(CloudBase):
             parameters['sku']['name'] = 'Premium_LRS'
             parameters['tier'] = disk_perf['disk_tier']
         try:
-            request = self.compute_client.disks.begin_create_or_update(resource_group, name, parameters)
-            request.wait()
-            return request.result()
+            return self.compute_client.disks.begin_create_or_update(resource_group, name, parameters)
         except Exception as err:
             raise AzureDriverError(f"error creating disk: {err}")
 
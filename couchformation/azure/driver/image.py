@@ -6,6 +6,7 @@ import re
 from typing import List, Union
 from couchformation.azure.driver.base import CloudBase, AzureDriverError, EmptyResultSet
 from couchformation.azure.driver.constants import AzureImagePublishers
+from couchformation.resources.catalog import CatalogManager
 import couchformation.constants as C
 
 logger = logging.getLogger('couchformation.azure.driver.image')
@@ -43,7 +44,18 @@ class Image(CloudBase):
 
         return image_list
 
-    def public(self, location: str, publisher: str, architecture: str = 'x86_64'):
+    def public(self, location: str, publisher: str, architecture: str = 'x86_64', refresh: bool = False):
+        catalog = CatalogManager('azure')
+        catalog_key = f"image:{location}:{publisher}:{architecture}"
+        if not refresh:
+            cached = catalog.get(catalog_key)
+            if cached:
+                return cached
+        result = self._public(location, publisher, architecture)
+        catalog.set(catalog_key, result)
+        return result
+
+    def _public(self, location: str, publisher: str, architecture: str = 'x86_64'):
         offer_list = []
         image_list = []
 
@@ -101,12 +113,12 @@ class Image(CloudBase):
         except Exception as err:
             raise AzureDriverError(f"can not delete image: {err}")
 
-    def list_standard(self, os_id: str = None, os_version: str = None, architecture: str = 'x86_64'):
+    def list_standard(self, os_id: str = None, os_version: str = None, architecture: str = 'x86_64', refresh: bool = False):
         result_list = []
         for image_type in AzureImagePublishers.publishers:
             if os_id and image_type['os_id'] != os_id:
                 continue
-            image_list = self.public(location=self.region, publisher=image_type['name'], architecture=architecture)
+            image_list = self.public(location=self.region, publisher=image_type['name'], architecture=architecture, refresh=refresh)
             for version in C.OS_VERSION_LIST[image_type['os_id']]:
                 if os_version and version != os_version:
                     continue
@@ -125,7 +137,7 @@ class Image(CloudBase):
                                 filtered_images.append(image)
                 if len(filtered_images) > 0:
                     filtered_images.sort(key=lambda i: i['version'])
-                    result_image = filtered_images[-1]
+                    result_image = dict(filtered_images[-1])
                     result_image.update(dict(
                         os_id=image_type['os_id'],
                         os_version=version,
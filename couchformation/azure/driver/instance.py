@@ -3,6 +3,7 @@
 
 import logging
 import json
+from typing import Union, List
 from azure.core.exceptions import ResourceNotFoundError
 from couchformation.azure.driver.base import CloudBase, AzureDriverError
 from couchformation.azure.driver.constants import AzureImagePublishers
@@ -42,7 +43,8 @@ class Instance(CloudBase):
             root_size=256,
             machine_type="Standard_D4_v3",
             password="Passw0rd!",
-            ultra=False):
+            ultra=False,
+            data_disks: Union[List[dict], None] = None):
         if not resource_group:
             resource_group = self.azure_resource_group
 
@@ -75,6 +77,7 @@ class Instance(CloudBase):
                     'name': root_disk_name,
                     'disk_size_gb': root_size,
                     'create_option': 'FromImage',
+                    'delete_option': 'Delete',
                     'managed_disk': {
                         'storage_account_type': root_type
                     }
@@ -83,6 +86,7 @@ class Instance(CloudBase):
             'network_profile': {
                 'network_interfaces': [{
                     'id': nic_id,
+                    'delete_option': 'Delete'
                 }]
             },
         }
@@ -108,6 +112,9 @@ class Instance(CloudBase):
                 }
             }
 
+        if data_disks:
+            parameters['storage_profile']['data_disks'] = data_disks
+
         parameters['os_profile'].update(os_config_block)
         if ultra:
             parameters['additional_capabilities'] = {}
@@ -125,16 +132,21 @@ class Instance(CloudBase):
         except Exception as err:
             raise AzureDriverError(f"error creating instance: {err}")
 
-    def attach_disk(self, instance: str, caching: str, lun: str, disk_id: str, resource_group: str):
-        parameters = {
+    @staticmethod
+    def data_disk(caching: str, lun: str, disk_id: str) -> dict:
+        return {
             'caching': caching,
             'lun': lun,
             'create_option': 'Attach',
+            'delete_option': 'Delete',
             'managed_disk': {
                 'id': disk_id
             }
         }
 
+    def attach_disk(self, instance: str, caching: str, lun: str, disk_id: str, resource_group: str):
+        parameters = self.data_disk(caching, lun, disk_id)
+
         try:
             vm = self.compute_client.virtual_machines.get(resource_group, instance)
             vm.storage_profile.data_disks.append(parameters)
@@ -153,9 +165,9 @@ class Instance(CloudBase):
         except Exception as err:
             raise AzureDriverError(f"error getting instance {instance}: {err}")
 
-    def terminate(self, instance: str, resource_group: str) -> None:
+    def terminate(self, instance: str, resource_group: str, force: bool = False) -> None:
         try:
-            request = self.compute_client.virtual_machines.begin_delete(resource_group, instance)
+            request = self.compute_client.virtual_machines.begin_delete(resource_group, instance, force_deletion=force)
             request.wait()
         except ResourceNotFoundError:
             return None
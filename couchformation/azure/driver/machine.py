@@ -6,6 +6,7 @@ import logging
 from typing import Union
 from couchformation.azure.driver.base import CloudBase, AzureDriverError
 from couchformation.azure.driver.constants import ComputeTypes
+from couchformation.resources.catalog import CatalogManager
 from couchformation.retry import retry
 import couchformation.constants as C
 
@@ -83,24 +84,40 @@ class MachineType(CloudBase):
             raise AzureDriverError(f"machine type {name} not available in location {location} or not enough capacity")
         return result
 
-    def check_capacity(self, machine_size: str, location: str):
+    def sku_index(self, location: str, refresh: bool = False) -> dict:
+        catalog = CatalogManager('azure', ttl=C.CATALOG_CAPACITY_TTL)
+        catalog_key = f"sku:{self.azure_subscription_id}:{location}"
+        if not refresh:
+            cached = catalog.get(catalog_key)
+            if cached:
+                return cached
+
+        sku_index = {}
         try:
             resource_list = self.compute_client.resource_skus.list(filter=f"location eq '{location}'")
         except Exception as err:
-            raise AzureDriverError(f"error getting vnet: {err}")
+            raise AzureDriverError(f"error getting resource SKUs: {err}")
 
         for resource in list(resource_list):
-            if machine_size != resource.name:
+            if resource.resource_type != 'virtualMachines':
                 continue
             zone_list = next((i.zones for i in resource.location_info if i.location == location), [])
-            if set(zone_list) != set(self.azure_availability_zones):
-                return False
             restrictions = list(r.reason_code for r in resource.restrictions if location in r.values)
-            if len(restrictions) > 0:
-                return False
-            return True
+            sku_index[resource.name] = {'zones': sorted(zone_list if zone_list else []),
+                                        'restrictions': restrictions}
 
-        return False
+        catalog.set(catalog_key, sku_index)
+        return sku_index
+
+    def check_capacity(self, machine_size: str, location: str):
+        resource = self.sku_index(location).get(machine_size)
+        if not resource:
+            return False
+        if set(resource['zones']) != set(self.azure_availability_zones):
+            return False
+        if len(resource['restrictions']) > 0:
+            return False
+        return True
 
     def details(self, machine_type: str) -> Union[dict, None]:
         try:
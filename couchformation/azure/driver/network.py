@@ -3,8 +3,12 @@
 
 import logging
 import re
+import copy
+import time
+import random
 from typing import Union, List
-from azure.core.exceptions import ResourceNotFoundError
+from azure.core.exceptions import ResourceNotFoundError, HttpResponseError
+from azure.core.polling import LROPoller
 from azure.mgmt.network.models import VirtualNetwork
 from couchformation.azure.driver.base import CloudBase, AzureDriverError, EmptyResultSet
 
@@ -97,6 +101,10 @@ class Network(CloudBase):
             raise AzureDriverError(f"error getting vnet: {err}")
 
     def create_pub_ip(self, name: str, resource_group: str):
+        request = self.begin_create_pub_ip(name, resource_group)
+        return self.poller_result(request, "creating public IP")
+
+    def begin_create_pub_ip(self, name: str, resource_group: str) -> LROPoller:
         parameters = {
             'location': self.azure_location,
             'public_ip_allocation_method': 'Static',
@@ -106,13 +114,15 @@ class Network(CloudBase):
         }
 
         try:
-            request = self.network_client.public_ip_addresses.begin_create_or_update(resource_group, name, parameters)
-            request.wait()
-            return request.result()
+            return self.network_client.public_ip_addresses.begin_create_or_update(resource_group, name, parameters)
         except Exception as err:
             raise AzureDriverError(f"can not create public IP: {err}")
 
     def create_nic(self, name: str, subnet_id: str, zone: str, pub_ip_id: str, resource_group: str):
+        request = self.begin_create_nic(name, subnet_id, zone, pub_ip_id, resource_group)
+        return self.poller_result(request, "creating nic")
+
+    def begin_create_nic(self, name: str, subnet_id: str, zone: str, pub_ip_id: str, resource_group: str) -> LROPoller:
         parameters = {
             'location': self.azure_location,
             'ip_configurations': [
@@ -131,9 +141,7 @@ class Network(CloudBase):
         }
 
         try:
-            request = self.network_client.network_interfaces.begin_create_or_update(resource_group, name, parameters)
-            request.wait()
-            return request.result()
+            return self.network_client.network_interfaces.begin_create_or_update(resource_group, name, parameters)
         except Exception as err:
             raise AzureDriverError(f"error creating nic: {err}")
 
@@ -279,10 +287,12 @@ class SecurityGroup(CloudBase):
 
         return nsg_list
 
-    def create(self, name: str, resource_group: str):
+    def create(self, name: str, resource_group: str, rules: Union[List[dict], None] = None):
         parameters = {
             'location': self.azure_location
         }
+        if rules:
+            parameters['security_rules'] = self.assign_priority(rules, [])
         try:
             request = self.network_client.network_security_groups.begin_create_or_update(resource_group, name, parameters)
             request.wait()
@@ -290,26 +300,19 @@ class SecurityGroup(CloudBase):
         except Exception as err:
             raise AzureDriverError(f"error creating network security group: {err}")
 
-    def add_rule(self,
-                 name: str,
-                 nsg_name: str,
-                 ports: list,
-                 priority: int,
-                 resource_group: str,
-                 protocol: str = "Tcp",
-                 source: Union[list, None] = None) -> None:
-        nsg_info = self.details(nsg_name, resource_group)
-        if not nsg_info:
-            raise AzureDriverError(f"can not find NSG {nsg_name} in {resource_group}")
+    @staticmethod
+    def rule(name: str,
+             ports: list,
+             priority: int = 0,
+             protocol: str = "Tcp",
+             source: Union[list, None] = None) -> dict:
         if source:
             default_source = None
         else:
             default_source = "*"
         protocol = protocol.lower().capitalize()
-        if priority == 0:
-            count = len(nsg_info.get('rules', []))
-            priority = (count + 101)
-        parameters = {
+        return {
+            "name": name,
             "description": "Cloud Formation Managed",
             "access": "Allow",
             "destination_address_prefix": "*",
@@ -321,12 +324,55 @@ class SecurityGroup(CloudBase):
             "source_address_prefixes": source,
             "source_port_range": "*",
         }
-        try:
-            request = self.network_client.security_rules.begin_create_or_update(resource_group, nsg_name, name, parameters)
-            request.wait()
-            return request.result()
-        except Exception as err:
-            raise AzureDriverError(f"error creating network security group rule: {err}")
+
+    @staticmethod
+    def assign_priority(rules: List[dict], used: List[int]) -> List[dict]:
+        used = set(used)
+        priority = len(used) + 101
+        for rule in rules:
+            if rule['priority'] == 0:
+                while priority in used:
+                    priority += 1
+                rule['priority'] = priority
+            used.add(rule['priority'])
+        return rules
+
+    def add_rule(self,
+                 name: str,
+                 nsg_name: str,
+                 ports: list,
+                 priority: int,
+                 resource_group: str,
+                 protocol: str = "Tcp",
+                 source: Union[list, None] = None) -> None:
+        return self.add_rules(nsg_name, [self.rule(name, ports, priority, protocol, source)], resource_group)
+
+    def add_rules(self, nsg_name: str, rules: List[dict], resource_group: str, retry_count: int = 10):
+        for retry_number in range(retry_count):
+            try:
+                nsg = self.network_client.network_security_groups.get(resource_group, nsg_name)
+            except ResourceNotFoundError:
+                raise AzureDriverError(f"can not find NSG {nsg_name} in {resource_group}")
+            except Exception as err:
+                raise AzureDriverError(f"error getting network security group: {err}")
+
+            rule_names = [rule['name'] for rule in rules]
+            existing = [r for r in nsg.security_rules if r.name not in rule_names] if nsg.security_rules else []
+            nsg.security_rules = existing + self.assign_priority(copy.deepcopy(rules), [r.priority for r in existing])
+
+            try:
+                request = self.network_client.network_security_groups.begin_create_or_update(resource_group, nsg_name, nsg, headers={'If-Match': nsg.etag})
+                request.wait()
+                return request.result()
+            except HttpResponseError as err:
+                if err.status_code != 412:
+                    raise AzureDriverError(f"error creating network security group rule: {err}")
+                logger.debug(f"NSG {nsg_name} was modified concurrently, retrying rule update")
+                time.sleep(random.uniform(0.5, 2.0) * (retry_number + 1))
+            except Exception as err:
+                raise AzureDriverError(f"error creating network security group rule: {err}")
+
+        raise AzureDriverError(f"can not update network security group {nsg_name}: too many concurrent modifications")
 
     def delete(self, name: str, resource_group: str) -> None:
         try:
@@ -5,6 +5,7 @@ import os
 import logging
 import random
 import string
+from functools import partial
 from itertools import cycle
 from typing import List
 from couchformation.network import NetworkDriver
@@ -192,9 +193,8 @@ class AzureNetwork(object):
                 cidr_util.set_active_network(vpc_cidr)
 
             if not self.state.get('network_security_group'):
-                nsg_resource = SecurityGroup(self.parameters).create(self.nsg_name, self.rg_name)
+                nsg_resource = SecurityGroup(self.parameters).create(self.nsg_name, self.rg_name, [SecurityGroup.rule("AllowSSH", ["22"], 100)])
                 nsg_resource_id = nsg_resource.id
-                SecurityGroup(self.parameters).add_rule("AllowSSH", self.nsg_name, ["22"], 100, self.rg_name)
                 self.state['network_security_group'] = self.nsg_name
                 self.state['network_security_group_id'] = nsg_resource_id
                 logger.info(f"Created network security group {self.nsg_name}")
@@ -268,6 +268,15 @@ class AzureNetwork(object):
         except Exception as err:
             raise AzureNetworkError(f"Error creating network: {err}")
 
+    @staticmethod
+    def port_rules(rule_name: str, port_cfg) -> List[dict]:
+        rules = []
+        if port_cfg.has_tcp_ports:
+            rules.append(SecurityGroup.rule(f"{rule_name}_TCP", list(port_cfg.tcp_as_ranges()), 0, "tcp"))
+        if port_cfg.has_udp_ports:
+            rules.append(SecurityGroup.rule(f"{rule_name}_UDP", list(port_cfg.udp_as_ranges()), 0, "udp"))
+        return rules
+
     @synchronize()
     def create_build_sg(self, build_name: str):
         nsg_name = self.network_security_group
@@ -278,10 +287,7 @@ class AzureNetwork(object):
             state_key_name = f"rule_{build_name}"
             build_rule_name = f"Allow{build_name.upper()}"
             if not self.state.get(state_key_name):
-                if build_port_cfg.has_tcp_ports:
-                    SecurityGroup(self.parameters).add_rule(f"{build_rule_name}_TCP", nsg_name, list(build_port_cfg.tcp_as_ranges()), 0, rg_name, "tcp")
-                if build_port_cfg.has_udp_ports:
-                    SecurityGroup(self.parameters).add_rule(f"{build_rule_name}_UDP", nsg_name, list(build_port_cfg.udp_as_ranges()), 0, rg_name, "udp")
+                SecurityGroup(self.parameters).add_rules(nsg_name, self.port_rules(build_rule_name, build_port_cfg), rg_name)
                 self.state[state_key_name] = build_rule_name
                 logger.info(f"Added NSG rule {build_rule_name}")
 
@@ -291,7 +297,7 @@ class AzureNetwork(object):
         rg_name = self.resource_group
         if not self.state.get('rule_win_rdp'):
             rule_name = "AllowRDP"
-            SecurityGroup(self.parameters).add_rule(rule_name, nsg_name, ["3389", "5985", "5986"], 0, rg_name, "tcp")
+            SecurityGroup(self.parameters).add_rules(nsg_name, [SecurityGroup.rule(rule_name, ["3389", "5985", "5986"], 0, "tcp")], rg_name)
             self.state['rule_win_rdp'] = rule_name
             logger.info(f"Added NSG rule {rule_name}")
 
@@ -303,10 +309,7 @@ class AzureNetwork(object):
         rule_name = f"Allow{service.upper()}{group:02d}"
         if not self.state.get(state_key_name):
             port_cfg = PortSettings().create(self.name, ports)
-            if port_cfg.has_tcp_ports:
-                SecurityGroup(self.parameters).add_rule(f"{rule_name}_TCP", nsg_name, list(port_cfg.tcp_as_ranges()), 0, rg_name, "tcp")
-            if port_cfg.has_udp_ports:
-                SecurityGroup(self.parameters).add_rule(f"{rule_name}_UDP", nsg_name, list(port_cfg.udp_as_ranges()), 0, rg_name, "udp")
+            SecurityGroup(self.parameters).add_rules(nsg_name, self.port_rules(rule_name, port_cfg), rg_name)
             self.state[state_key_name] = rule_name
             logger.info(f"Added NSG rule {rule_name}")
 
@@ -340,9 +343,43 @@ class AzureNetwork(object):
                 logger.warning("No saved network")
                 return
 
+            if self.state.get('parent_hosted_zone') and self.state.get('domain'):
+                DNS(self.parameters).delete_record(self.state['parent_hosted_zone'], self.state['domain'], self.state['parent_hosted_zone_rg'], 'NS')
+                del self.state['parent_hosted_zone']
+                del self.state['parent_zone_ns_records']
+                logger.info(f"Removing NS records for domain {self.state['domain']}")
+
+            rg_info = self.az_base.get_rg(rg_name, self.az_base.region)
+            rg_tags = rg_info.get('tags') if rg_info and rg_info.get('tags') else {}
+
+            if rg_name == self.rg_name and rg_tags.get('type') == 'couch-formation':
+                logger.info(f"Removing project resource group {rg_name}")
+                self.az_base.delete_rg(rg_name)
+            else:
+                subnet_name = self.state.get('subnet')
+                nsg_name = self.state.get('network_security_group')
+                public_zone = self.state.get('public_hosted_zone')
+                private_zone = self.state.get('private_hosted_zone')
+                private_link = self.state.get('private_dns_zone_link')
+
+                tasks = []
+                if subnet_name:
+                    tasks.append(partial(Subnet(self.parameters).delete, vpc_name, subnet_name, rg_name))
+                if public_zone:
+                    tasks.append(partial(DNS(self.parameters).delete, public_zone, rg_name))
+                if private_link:
+                    tasks.append(partial(PrivateDNS(self.parameters).vpc_unlink, private_zone, private_link, rg_name))
+                self.az_base.run_parallel(tasks)
+
+                tasks = [partial(Network(self.parameters).delete, vpc_name, rg_name)]
+                if nsg_name:
+                    tasks.append(partial(SecurityGroup(self.parameters).delete, nsg_name, rg_name))
+                if private_zone:
+                    tasks.append(partial(PrivateDNS(self.parameters).delete, private_zone, rg_name))
+                self.az_base.run_parallel(tasks)
+
             if self.state.get('subnet'):
                 subnet_name = self.state.get('subnet')
-                Subnet(self.parameters).delete(vpc_name, subnet_name, rg_name)
                 del self.state['subnet']
                 del self.state['subnet_id']
                 logger.info(f"Removed subnet {subnet_name}")
@@ -352,7 +389,6 @@ class AzureNetwork(object):
 
             if self.state.get('network_security_group'):
                 nsg_name = self.state.get('network_security_group')
-                SecurityGroup(self.parameters).delete(nsg_name, rg_name)
                 del self.state['network_security_group']
                 del self.state['network_security_group_id']
                 logger.info(f"Removed network security group {nsg_name}")
@@ -365,33 +401,22 @@ class AzureNetwork(object):
             for n, zone_state in reversed(list(enumerate(self.state.list_get('zone')))):
                 self.state.list_remove('zone', zone_state[0])
 
-            if self.state.get('parent_hosted_zone') and self.state.get('domain'):
-                DNS(self.parameters).delete_record(self.state['parent_hosted_zone'], self.state['domain'], self.state['parent_hosted_zone_rg'], 'NS')
-                del self.state['parent_hosted_zone']
-                del self.state['parent_zone_ns_records']
-                logger.info(f"Removing NS records for domain {self.state['domain']}")
-
             if self.state.get('public_hosted_zone'):
                 domain_id = self.state.get('public_hosted_zone')
-                DNS(self.parameters).delete(domain_id, rg_name)
                 del self.state['public_hosted_zone']
                 logger.info(f"Removing public hosted zone {domain_id}")
 
             if self.state.get('private_dns_zone_link'):
                 domain_id = self.state.get('private_hosted_zone')
-                PrivateDNS(self.parameters).vpc_unlink(domain_id, self.state['private_dns_zone_link'], rg_name)
                 del self.state['private_dns_zone_link']
                 logger.info(f"Removing private DNS zone link for {domain_id}")
 
             if self.state.get('private_hosted_zone'):
                 domain_id = self.state.get('private_hosted_zone')
-                PrivateDNS(self.parameters).delete(domain_id, rg_name)
                 del self.state['private_hosted_zone']
                 logger.info(f"Removing private hosted zone {domain_id}")
 
             if self.state.get('network'):
-                vpc_name = self.state.get('network')
-                Network(self.parameters).delete(vpc_name, rg_name)
                 del self.state['network']
                 del self.state['network_cidr']
                 del self.state['network_id']
@@ -3,6 +3,7 @@
 
 import re
 import logging
+from functools import partial
 from itertools import cycle, islice
 from couchformation.azure.driver.base import CloudBase
 from couchformation.azure.driver.network import Network
@@ -204,22 +205,30 @@ class AzureDeployment(object):
             self.az_network.create_win_sg()
             logger.info("Requesting windows firewall rule")
 
+        disk_driver = Disk(self.parameters)
+        network_driver = Network(self.parameters)
+
         logger.info(f"Creating disk {self.swap_encoded} ({self.swap_disk})")
-        swap_resource = Disk(self.parameters).create(rg_name, azure_location, subnet['zone'], machine_ram, self.swap_encoded, self.ultra)
+        swap_request = disk_driver.begin_create(rg_name, azure_location, subnet['zone'], machine_ram, self.swap_encoded, self.ultra)
         self.state['swap_disk'] = self.swap_encoded
 
         logger.info(f"Creating disk {self.data_encoded} ({self.data_disk})")
-        data_resource = Disk(self.parameters).create(rg_name, azure_location, subnet['zone'], volume_size, self.data_encoded, self.ultra)
+        data_request = disk_driver.begin_create(rg_name, azure_location, subnet['zone'], volume_size, self.data_encoded, self.ultra)
         self.state['data_disk'] = self.data_encoded
 
         logger.info(f"Creating public IP {self.pub_ip_encoded} ({self.node_pub_ip})")
-        pub_ip_resource = Network(self.parameters).create_pub_ip(self.pub_ip_encoded, rg_name)
+        pub_ip_request = network_driver.begin_create_pub_ip(self.pub_ip_encoded, rg_name)
         self.state['node_pub_ip'] = self.pub_ip_encoded
+        pub_ip_resource = network_driver.poller_result(pub_ip_request, "creating public IP")
 
         logger.info(f"Creating NIC {self.nic_encoded} ({self.node_nic})")
-        nic_resource = Network(self.parameters).create_nic(self.nic_encoded, subnet['subnet_id'], subnet['zone'], pub_ip_resource.id, rg_name)
+        nic_request = network_driver.begin_create_nic(self.nic_encoded, subnet['subnet_id'], subnet['zone'], pub_ip_resource.id, rg_name)
         self.state['node_nic'] = self.nic_encoded
 
+        swap_resource = disk_driver.poller_result(swap_request, "creating disk")
+        data_resource = disk_driver.poller_result(data_request, "creating disk")
+        nic_resource = network_driver.poller_result(nic_request, "creating nic")
+
         if image['os_id'] == 'windows' and not self.state['host_password']:
             self.state['host_password'] = self.password
         elif self.state['host_password']:
@@ -238,12 +247,11 @@ class AzureDeployment(object):
                                       self.boot_encoded,
                                       machine_type=machine_name,
                                       password=self.password,
-                                      ultra=self.ultra)
-
-        logger.info(f"Attaching disk {self.swap_encoded}")
-        Instance(self.parameters).attach_disk(self.node_encoded, self.az_base.disk_caching(machine_ram, self.ultra), "1", swap_resource.id, rg_name)
-        logger.info(f"Attaching disk {self.data_encoded}")
-        Instance(self.parameters).attach_disk(self.node_encoded, self.az_base.disk_caching(volume_size, self.ultra), "2", data_resource.id, rg_name)
+                                      ultra=self.ultra,
+                                      data_disks=[
+                                          Instance.data_disk(self.az_base.disk_caching(machine_ram, self.ultra), "1", swap_resource.id),
+                                          Instance.data_disk(self.az_base.disk_caching(volume_size, self.ultra), "2", data_resource.id)
+                                      ])
 
         self.state['instance_id'] = self.node_encoded
         self.state['name'] = self.node_encoded
@@ -253,10 +261,8 @@ class AzureDeployment(object):
         self.state['boot_disk'] = self.boot_encoded
         self.az_network.add_service(self.node_name)
 
-        nic_details = Network(self.parameters).describe_nic(self.nic_encoded, rg_name)
-        pub_ip_details = Network(self.parameters).describe_pub_ip(self.pub_ip_encoded, rg_name)
-        self.state['public_ip'] = pub_ip_details.ip_address
-        self.state['private_ip'] = nic_details.ip_configurations[0].private_ip_address
+        self.state['public_ip'] = pub_ip_resource.ip_address
+        self.state['private_ip'] = nic_resource.ip_configurations[0].private_ip_address
 
         if self.az_network.public_zone and self.az_network.domain_name and not self.state.get('public_hostname'):
             host_name = f"{self.node_name}.{self.az_network.domain_name}"
@@ -305,18 +311,22 @@ class AzureDeployment(object):
             instance_name = self.state['instance_id']
             node_nic = self.state['node_nic']
             node_pub_ip = self.state['node_pub_ip']
-            Instance(self.parameters).terminate(instance_name, rg_name)
+            Instance(self.parameters).terminate(instance_name, rg_name, force=True)
             logger.info(f"Removed instance {instance_name}")
-            Network(self.parameters).delete_nic(node_nic, rg_name)
-            logger.info(f"Removed NIC {node_nic}")
-            Network(self.parameters).delete_pub_ip(node_pub_ip, rg_name)
-            logger.info(f"Removed public IP {node_pub_ip}")
-            Disk(self.parameters).delete(self.state['swap_disk'], rg_name)
-            logger.info(f"Removed disk {self.state['swap_disk']}")
-            Disk(self.parameters).delete(self.state['data_disk'], rg_name)
-            logger.info(f"Removed disk {self.state['data_disk']}")
-            Disk(self.parameters).delete(self.state['boot_disk'], rg_name)
-            logger.info(f"Removed disk {self.state['boot_disk']}")
+            disk_driver = Disk(self.parameters)
+            network_driver = Network(self.parameters)
+            disk_list = [self.state[key] for key in ('swap_disk', 'data_disk', 'boot_disk') if self.state.get(key)]
+            tasks = [partial(disk_driver.delete, disk, rg_name) for disk in disk_list]
+            if node_nic:
+                tasks.append(partial(network_driver.delete_nic, node_nic, rg_name))
+            self.az_base.run_parallel(tasks)
+            for disk in disk_list:
+                logger.info(f"Removed disk {disk}")
+            if node_nic:
+                logger.info(f"Removed NIC {node_nic}")
+            if node_pub_ip:
+                network_driver.delete_pub_ip(node_pub_ip, rg_name)
+                logger.info(f"Removed public IP {node_pub_ip}")
             self.state.clear()
             self.az_network.remove_service(self.node_name)
             logger.info(f"Removed instance {instance_name}")
@@ -2,6 +2,7 @@
 ##
 
 import logging
+import threading
 from couchformation.exception import FatalError
 from couchformation.resources.config_manager import ConfigurationManager
 from libcapella.config import CapellaConfig
@@ -19,6 +20,7 @@ class CapellaDriverError(FatalError):
 
 
 class CloudBase(object):
+    project_lock = threading.Lock()
 
     def __init__(self, parameters: dict):
         self.parameters = parameters
@@ -63,13 +65,14 @@ class CloudBase(object):
                 raise CapellaDriverError("Capella v4 API token not set")
 
             self.org = CapellaOrganization(config)
-            self._project = CapellaProject(self.org, self._project_name, self._account_email)
-            if not self._project.id:
-                logger.info(f"Creating project {self._project_name}")
-                builder = CapellaProjectBuilder()
-                builder = builder.name(self._project_name)
-                config = builder.build()
-                self._project.create(config)
+            with CloudBase.project_lock:
+                self._project = CapellaProject(self.org, self._project_name, self._account_email)
+                if not self._project.id:
+                    logger.info(f"Creating project {self._project_name}")
+                    builder = CapellaProjectBuilder()
+                    builder = builder.name(self._project_name)
+                    config = builder.build()
+                    self._project.create(config)
         except Exception as err:
             raise CapellaDriverError(f"can not access Capella project {self._project_name}: {err}")
 
@@ -11,6 +11,7 @@ import couchformation
 from couchformation.cli.cli import CLI
 from couchformation.project import Project
 from couchformation.resources.config_manager import ConfigurationManager
+from couchformation.resources.catalog import CatalogManager
 from couchformation.support.debug import CreateDebugPackage
 from couchformation.ssh import SSHUtil
 
@@ -64,6 +65,13 @@ class CloudMgrCLI(CLI):
         config_parser.add_parser('set', help="Get Config Elements", add_help=False)
         config_parser.add_parser('unset', help="Get Config Elements", add_help=False)
 
+        catalog_opt_parser = argparse.ArgumentParser(add_help=False)
+        catalog_opt_parser.add_argument('-c', '--cloud', action='store', help="Infrastructure", default=None)
+
+        catalog_cmd = command_subparser.add_parser('catalog', help="Image and Machine Catalog", add_help=False)
+        catalog_parser = catalog_cmd.add_subparsers(dest='catalog_command')
+        catalog_parser.add_parser('refresh', help="Discard Cached Catalog Entries", parents=[catalog_opt_parser], add_help=False)
+
         ssh_opt_parser = argparse.ArgumentParser(add_help=False)
         ssh_opt_parser.add_argument('-n', '--name', action='store', help="Key Name", default="cf-key-pair")
         ssh_opt_parser.add_argument('-r', '--replace', action='store_true', help="Replace existing key")
@@ -93,6 +101,10 @@ class CloudMgrCLI(CLI):
             self.ssh_mgr(self.options)
             return
 
+        if self.options.command == "catalog":
+            self.catalog_mgr(self.options)
+            return
+
         if self.options.command == "dump":
             CreateDebugPackage().create_snapshot()
             return
@@ -204,6 +216,17 @@ class CloudMgrCLI(CLI):
         else:
             logger.error(f"Unknown config command: {command}")
 
+    @staticmethod
+    def catalog_mgr(options: argparse.Namespace):
+        if options.catalog_command == "refresh":
+            if options.cloud:
+                CatalogManager(options.cloud).reset()
+            else:
+                CatalogManager.reset_all()
+            logger.info("Catalog cache cleared")
+        else:
+            logger.error(f"Unknown catalog command: {options.catalog_command}")
+
     @staticmethod
     def ssh_mgr(options: argparse.Namespace):
         cm = ConfigurationManager()
@@ -2,8 +2,11 @@
 ##
 
 import logging
+import threading
+import time
 import docker
-from docker import APIClient
+from docker.models.containers import Container as ContainerClass
+from typing import Union
 from couchformation.exception import FatalError, NonFatalError
 
 logger = logging.getLogger('couchformation.docker.driver.base')
@@ -20,26 +23,118 @@ class EmptyResultSet(NonFatalError):
     pass
 
 
+class ContainerCache(object):
+    ttl = 30
+    backoff_initial = 1.0
+    backoff_max = 60.0
+
+    def __init__(self, client: docker.DockerClient):
+        self.client = client
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.watcher = None
+        self.connected = False
+        self.generation = 0
+        self.stopped = threading.Event()
+
+    def get(self, name: str) -> Union[ContainerClass, None]:
+        self.watch()
+        with self.lock:
+            generation = self.generation if self.connected else None
+            entry = self.entries.get(name)
+            if generation is not None and entry and time.time() - entry[0] < self.ttl:
+                return entry[1]
+
+        try:
+            container = self.client.containers.get(name)
+        except docker.errors.NotFound:
+            return None
+
+        with self.lock:
+            if generation is not None and self.connected and self.generation == generation:
+                self.entries[name] = (time.time(), container)
+        return container
+
+    def invalidate(self, key: Union[str, None] = None):
+        with self.lock:
+            if not key:
+                self.entries.clear()
+                return
+            for name in [k for k, v in self.entries.items() if k == key or v[1].id == key or v[1].name == key]:
+                del self.entries[name]
+
+    def watch(self):
+        with self.lock:
+            if self.watcher:
+                return
+            self.watcher = threading.Thread(target=self.events, daemon=True)
+            self.watcher.start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def set_connected(self, connected: bool):
+        with self.lock:
+            self.connected = connected
+            self.generation += 1
+            self.entries.clear()
+
+    def events(self):
+        delay = self.backoff_initial
+        while not self.stopped.is_set():
+            try:
+                stream = self.client.events(decode=True, filters={'type': ['container', 'network']})
+                self.set_connected(True)
+                delay = self.backoff_initial
+                for event in stream:
+                    actor = event.get('Actor', {})
+                    attributes = actor.get('Attributes', {})
+                    if event.get('Type') == 'network':
+                        self.invalidate(attributes.get('container'))
+                    else:
+                        self.invalidate(actor.get('ID'))
+                        self.invalidate(attributes.get('name'))
+                    if self.stopped.is_set():
+                        break
+                logger.debug("Docker event stream closed")
+            except Exception as err:
+                logger.debug(f"Docker event stream error: {err}")
+            self.set_connected(False)
+            if self.stopped.wait(delay):
+                break
+            delay = min(delay * 2, self.backoff_max)
+
+
 class CloudBase(object):
+    client = None
+    container_cache = None
+    arch = None
+    cache_lock = threading.Lock()
 
     def __init__(self, parameters: dict):
         self.parameters = parameters
         self.project = parameters.get('project')
         self.name = parameters.get('name')
 
-        self.client = docker.from_env()
-        self.docker_api = APIClient(base_url='unix://var/run/docker.sock')
-        stats = self.docker_api.version()
-        eng = next((c for c in stats.get('Components', [{}]) if c.get('Name') == 'Engine'), None)
+        self.client = self.get_client()
+        self.docker_api = self.client.api
 
-        self.arch = eng.get('Details', {}).get('Arch')
+    @staticmethod
+    def get_client() -> docker.DockerClient:
+        with CloudBase.cache_lock:
+            if not CloudBase.client:
+                client = docker.from_env()
+                stats = client.api.version()
+                eng = next((c for c in stats.get('Components', [{}]) if c.get('Name') == 'Engine'), None)
+                CloudBase.arch = eng.get('Details', {}).get('Arch')
+                CloudBase.container_cache = ContainerCache(client)
+                CloudBase.client = client
+            return CloudBase.client
 
     @staticmethod
     def test_session():
         try:
-            docker_api = APIClient(base_url='unix://var/run/docker.sock')
-            docker_api.version()
-            client = docker.from_env()
+            client = CloudBase.get_client()
             client.info()
         except Exception as err:
             raise DockerDriverError(f"not authorized: {err}")
@@ -3,14 +3,16 @@
 
 import io
 import os
+import hashlib
 import logging
+import threading
 import docker
 import jinja2
 import tarfile
 from jinja2.meta import find_undeclared_variables
 from docker.errors import APIError
 from docker.models.containers import Container as ContainerClass
-from typing import Union, List, Set
+from typing import Union, List, Set, Callable, Iterator
 from couchformation.docker.driver.base import CloudBase, DockerDriverError
 from couchformation.docker.util import ContainerProfile, ContainerSpec
 from couchformation.util import FileManager
@@ -23,6 +25,8 @@ logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
 class Container(CloudBase):
+    cpu_lock = threading.Lock()
+    cpu_reserved = {}
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -31,19 +35,23 @@ class Container(CloudBase):
         container_list = []
 
         try:
-            containers = self.client.containers.list()
+            containers = self.docker_api.containers()
         except Exception as err:
             raise DockerDriverError(f"error getting container list: {err}")
 
         for container in containers:
-            if name and container.name != name:
+            container_name = container.get('Names', ['/'])[0].lstrip('/')
+            if name and container_name != name:
                 continue
-            container_block = {'name': container.name,
-                               'short_id': container.short_id,
-                               'status': container.status,
-                               'ports': self.get_container_ports(container.name),
-                               'ip_address': self.get_container_ip(container.name),
-                               'id': container.id}
+            ports = sorted(set(str(p['PrivatePort']) for p in container.get('Ports', []) if p.get('PrivatePort')), key=int)
+            networks = container.get('NetworkSettings', {}).get('Networks', {})
+            ip_address = next((n.get('IPAddress') for n in networks.values() if n.get('IPAddress')), '')
+            container_block = {'name': container_name,
+                               'short_id': container['Id'][:12],
+                               'status': container.get('State'),
+                               'ports': ports,
+                               'ip_address': ip_address,
+                               'id': container['Id']}
             container_list.append(container_block)
 
         if len(container_list) == 0:
@@ -51,6 +59,13 @@ class Container(CloudBase):
         else:
             return container_list
 
+    def port_index(self) -> dict:
+        index = {}
+        for container in self.list() or []:
+            for port in container['ports']:
+                index.setdefault(port, []).append(container['ip_address'])
+        return index
+
     @staticmethod
     def expand_ranges(text):
         range_list = []
@@ -79,7 +94,12 @@ class Container(CloudBase):
             platform: Union[str, None] = None,
             ports: Union[str, None] = None,
             network: Union[str, None] = None,
-            command: Union[str, list, None] = None) -> ContainerClass:
+            command: Union[str, list, None] = None,
+            cpu_set: Union[str, None] = None,
+            cpu_count: Union[int, None] = None,
+            mem_limit: Union[str, None] = None,
+            blkio_weight: Union[int, None] = None,
+            cache_image: Union[str, None] = None) -> ContainerClass:
         if self.map(image):
             image = self.map(image)
         cp = ContainerProfile()
@@ -105,6 +125,16 @@ class Container(CloudBase):
         if not command and ip.volume and ip.volume.command:
             command = ip.volume.command
 
+        if not cpu_set and not cpu_count:
+            cpu_set = ip.resources.cpu_set
+            cpu_count = ip.resources.cpu_count
+        if not mem_limit:
+            mem_limit = ip.resources.mem_limit
+        if not blkio_weight:
+            blkio_weight = ip.resources.blkio_weight
+        if not cpu_set and cpu_count:
+            cpu_set = self.assign_cpus(int(cpu_count), name)
+
         port_struct = self.create_port_dict(self.expand_ranges(ports))
 
         try:
@@ -115,7 +145,7 @@ class Container(CloudBase):
                 if not volume_mount:
                     volume_mount = dir_mount
                 volume_map = [f"{dir_mount}:{volume_mount}"]
-            container_id = self.client.containers.run(image,
+            container_id = self.client.containers.run(cache_image if cache_image else image,
                                                       tty=True,
                                                       detach=True,
                                                       platform=platform,
@@ -123,7 +153,10 @@ class Container(CloudBase):
                                                       ports=port_struct,
                                                       network=network,
                                                       volumes=volume_map,
-                                                      command=command
+                                                      command=command,
+                                                      cpuset_cpus=cpu_set,
+                                                      mem_limit=mem_limit,
+                                                      blkio_weight=int(blkio_weight) if blkio_weight else None
                                                       )
         except docker.errors.APIError as e:
             if e.status_code == 409:
@@ -134,6 +167,63 @@ class Container(CloudBase):
         logger.debug("Container started")
         return container_id
 
+    @staticmethod
+    def cache_tag(build: str,
+                  image: str,
+                  os_id: Union[str, None] = None,
+                  sw_version: Union[str, None] = None,
+                  commands: Union[List[str], None] = None) -> str:
+        version = sw_version if sw_version else "latest"
+        fingerprint = '\n'.join([image, os_id if os_id else ''] + (commands if commands else []))
+        digest = hashlib.sha256(fingerprint.encode()).hexdigest()[:12]
+        return f"couchformation-cache/{build}:{version}-{digest}"
+
+    def cached_image(self, tag: str, image: str) -> bool:
+        if self.map(image):
+            image = self.map(image)
+        try:
+            cached = self.client.images.get(tag)
+            base = self.client.images.get(image)
+        except docker.errors.ImageNotFound:
+            return False
+        return cached.labels.get('couchformation.base') == base.id
+
+    def commit(self, name: str, tag: str):
+        container_id = self.get_container_id(name)
+        if not container_id:
+            raise DockerDriverError(f"container {name} not found")
+        repository, version = tag.rsplit(':', 1)
+        try:
+            container_id.commit(repository=repository, tag=version, conf={'Labels': {'couchformation.base': container_id.attrs['Image']}})
+        except APIError as err:
+            raise DockerDriverError(f"can not commit container {name}: {err}")
+
+    def assign_cpus(self, cpu_count: int, name: str) -> Union[str, None]:
+        host_cpus = self.client.info().get('NCPU', 0)
+        if cpu_count >= host_cpus:
+            logger.warning(f"Requested {cpu_count} cores but the host has {host_cpus}, not pinning cores")
+            return None
+        with Container.cpu_lock:
+            assigned = {}
+            try:
+                for container in self.client.containers.list(all=True):
+                    cpu_set = container.attrs.get('HostConfig', {}).get('CpusetCpus')
+                    if cpu_set and container.name != name:
+                        assigned[container.name] = self.expand_ranges(cpu_set)
+            except APIError as err:
+                raise DockerDriverError(f"can not list containers: {err}")
+            assigned.update({k: v for k, v in Container.cpu_reserved.items() if k != name})
+            usage = [0] * host_cpus
+            for cores in assigned.values():
+                for core in cores:
+                    if core < host_cpus:
+                        usage[core] += 1
+            cores = sorted(sorted(range(host_cpus), key=lambda c: usage[c])[:cpu_count])
+            if any(usage[core] for core in cores):
+                logger.warning(f"Not enough free host cores for {name}, core assignment will overlap")
+            Container.cpu_reserved[name] = cores
+        return ','.join(str(core) for core in cores)
+
     @staticmethod
     def map(build: str):
         try:
@@ -146,11 +236,8 @@ class Container(CloudBase):
 
     @staticmethod
     def get_container_id(name: str) -> Union[ContainerClass, None]:
-        client = docker.from_env()
-        try:
-            return client.containers.get(name)
-        except docker.errors.NotFound:
-            return None
+        CloudBase.get_client()
+        return CloudBase.container_cache.get(name)
 
     def get_container_ip(self, name: str):
         container_id = self.get_container_id(name)
@@ -181,18 +268,17 @@ class Container(CloudBase):
 
     def process_template(self, profile: ContainerSpec) -> str:
         tags = []
+        port_index = None
         variables = self.get_template_tags(profile.volume.content)
         for variable in variables:
             if variable.startswith('port'):
-                ip_list = []
+                if port_index is None:
+                    port_index = self.port_index()
                 try:
                     check_port = variable.split('_')[1]
                 except IndexError:
                     check_port = "0"
-                for container in self.list():
-                    if check_port in container.get('ports'):
-                        ip_list.append(container.get('ip_address'))
-                ip_list_str = ','.join(ip_list)
+                ip_list_str = ','.join(port_index.get(check_port, []))
                 tags.append((variable, ip_list_str))
             elif variable == 'dir_name' and profile.volume.directory:
                 tags.append((variable, profile.volume.directory))
@@ -215,6 +301,45 @@ class Container(CloudBase):
         buffer.seek(0)
         return exit_code, buffer
 
+    def stream_in_container(self,
+                            name: str,
+                            command: Union[str, List[str]],
+                            output: Callable[[str, str], None],
+                            directory: Union[str, None] = None,
+                            root: bool = True,
+                            max_line: int = 65536) -> int:
+        cmd_prefix = ['sh', '-c']
+        container_id = self.get_container_id(name)
+        if not container_id:
+            raise DockerDriverError(f"container {name} not found")
+        if type(command) is str:
+            command = [command]
+        cmd_prefix.extend(command)
+
+        try:
+            exec_id = self.docker_api.exec_create(container_id.id, cmd_prefix, workdir=directory, user="root" if root else "")
+            stream = self.docker_api.exec_start(exec_id, stream=True, demux=True)
+        except APIError as err:
+            raise DockerDriverError(f"can not run command in container {name}: {err}")
+
+        pending = {'stdout': b'', 'stderr': b''}
+        for chunks in stream:
+            for source, chunk in zip(('stdout', 'stderr'), chunks):
+                if not chunk:
+                    continue
+                lines = (pending[source] + chunk).split(b'\n')
+                pending[source] = lines.pop()
+                if len(pending[source]) > max_line:
+                    lines.append(pending[source])
+                    pending[source] = b''
+                for line in lines:
+                    output(line.decode('utf-8', errors='replace').rstrip(), source)
+        for source, line in pending.items():
+            if line:
+                output(line.decode('utf-8', errors='replace').rstrip(), source)
+
+        return self.docker_api.exec_inspect(exec_id).get('ExitCode')
+
     def get_home_path(self, name: str) -> Union[str, None]:
         exit_code, output = self.run_in_container(name, "printf %s ~")
         if exit_code != 0:
@@ -222,37 +347,77 @@ class Container(CloudBase):
         else:
             return output.read().decode('utf-8')
 
-    def copy_file_to_container(self, name: str, src: str, dst: str):
+    @staticmethod
+    def archive_stream(writer: Callable[[tarfile.TarFile], None], chunk_size: int = 1048576) -> Iterator[bytes]:
+        read_fd, write_fd = os.pipe()
+        errors = []
+
+        def producer():
+            try:
+                with os.fdopen(write_fd, 'wb') as pipe, tarfile.open(fileobj=pipe, mode='w|') as tar:
+                    writer(tar)
+            except Exception as err:
+                errors.append(err)
+
+        thread = threading.Thread(target=producer, daemon=True)
+        thread.start()
+        with os.fdopen(read_fd, 'rb') as pipe:
+            while True:
+                chunk = pipe.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        thread.join()
+        if errors:
+            raise DockerDriverError(f"error creating archive: {errors[0]}")
+
+    def copy_to_container(self, name: str, sources: List[str], dst: str):
         container_id = self.get_container_id(name)
-        stream = io.BytesIO()
-        with tarfile.open(fileobj=stream, mode='w|') as tar, open(src, 'rb') as file:
-            info = tar.gettarinfo(fileobj=file)
-            info.name = os.path.basename(src)
-            tar.addfile(info, file)
-        container_id.put_archive(dst, stream.getvalue())
+        if not container_id:
+            raise DockerDriverError(f"container {name} not found")
+
+        def writer(tar: tarfile.TarFile):
+            for src in sources:
+                tar.add(src, arcname=os.path.basename(os.path.normpath(src)))
+
+        try:
+            container_id.put_archive(dst, self.archive_stream(writer))
+        except APIError as err:
+            raise DockerDriverError(f"can not copy to container {name}: {err}")
+
+    def copy_file_to_container(self, name: str, src: str, dst: str):
+        self.copy_to_container(name, [src], dst)
 
     def copy_io_to_container(self, name: str, fl: io, dst: str):
         fl.seek(0)
         container_id = self.get_container_id(name)
+        if not container_id:
+            raise DockerDriverError(f"container {name} not found")
         home_path = self.get_home_path(name)
         if not home_path:
             home_path = "/root"
-        stream = io.BytesIO()
-        with tarfile.open(fileobj=stream, mode='w|') as tar:
+
+        def writer(tar: tarfile.TarFile):
             info = tarfile.TarInfo(name=dst)
             info.size = fl.getbuffer().nbytes
             tar.addfile(info, fl)
-        container_id.put_archive(home_path, stream.getvalue())
+
+        try:
+            container_id.put_archive(home_path, self.archive_stream(writer))
+        except APIError as err:
+            raise DockerDriverError(f"can not copy to container {name}: {err}")
 
     def terminate(self, name: str) -> None:
         container_id = self.get_container_id(name)
         if not container_id:
             return
-        client = docker.from_env()
         container_id.stop()
         container_id.remove()
+        self.container_cache.invalidate(name)
+        with Container.cpu_lock:
+            Container.cpu_reserved.pop(name, None)
         try:
-            volume = client.volumes.get(f"{name}-vol")
+            volume = self.client.volumes.get(f"{name}-vol")
             volume.remove()
         except docker.errors.NotFound:
             pass
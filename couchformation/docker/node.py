@@ -6,6 +6,7 @@ from couchformation.docker.driver.container import Container
 from couchformation.config import get_state_file, get_state_dir, PortSettingSet, PortSettings, State
 from couchformation.docker.network import DockerNetwork
 from couchformation.exception import FatalError
+from couchformation.executor.targets import BuildProfile
 from couchformation.kvdb import KeyValueStore
 from couchformation.util import FileManager, Synchronize
 from couchformation.network import NetworkUtil
@@ -29,6 +30,13 @@ class DockerDeployment(object):
         self.image = self.build if Container(self.parameters).map(self.build) else parameters.get('image')
         self.number = parameters.get('number')
         self.services = parameters.get('services') if parameters.get('services') else "default"
+        self.cpu_set = parameters.get('cpu_set')
+        self.cpu_count = parameters.get('cpu_count')
+        self.mem_limit = parameters.get('mem_limit')
+        self.blkio_weight = parameters.get('blkio_weight')
+        self.image_cache = parameters.get('image_cache') if parameters.get('image_cache') else False
+        self.sw_version = parameters.get('sw_version')
+        self.os_id = parameters.get('os_id')
         self.node_name = f"{self.name}-node-{self.number:02d}"
 
         filename = get_state_file(self.project, self.name)
@@ -75,8 +83,28 @@ class DockerDeployment(object):
         else:
             ports = None
 
+        cache_image = None
+        if self.image_cache:
+            default_seq = BuildProfile().get('default')
+            commands = [command for build_config in default_seq.get('docker') if self.os_id not in build_config.exclude for command in build_config.commands]
+            base_image = Container.map(self.image) if Container.map(self.image) else self.image
+            cache_tag = Container.cache_tag(self.build, base_image, self.os_id, self.sw_version, commands)
+            if Container(self.parameters).cached_image(cache_tag, self.image):
+                logger.info(f"Using provisioned image {cache_tag}")
+                cache_image = cache_tag
+                self.state['cache_hit'] = True
+            self.state['cache_image'] = cache_tag
+
         logger.info(f"Creating container {self.node_name}")
-        container = Container(self.parameters).run(self.image, self.node_name, network=net_name, ports=ports)
+        container = Container(self.parameters).run(self.image,
+                                                   self.node_name,
+                                                   network=net_name,
+                                                   ports=ports,
+                                                   cpu_set=self.cpu_set,
+                                                   cpu_count=self.cpu_count,
+                                                   mem_limit=self.mem_limit,
+                                                   blkio_weight=self.blkio_weight,
+                                                   cache_image=cache_image)
 
         public_ip = NetworkUtil().local_ip_address()
         private_ip = Container(self.parameters).get_container_ip(self.node_name)
@@ -86,6 +114,7 @@ class DockerDeployment(object):
         self.state['services'] = services
         self.state['public_ip'] = public_ip if public_ip else private_ip
         self.state['private_ip'] = private_ip
+        self.state['cpu_set'] = container.attrs.get('HostConfig', {}).get('CpusetCpus')
         self.docker_network.add_service(self.node_name)
 
         logger.info(f"Created container {self.node_name}")
@@ -18,12 +18,21 @@ class VolumeSpec:
     name: Optional[str] = attr.ib()
 
 
+@attr.s
+class ResourceSpec:
+    cpu_set: Optional[str] = attr.ib(default=None)
+    cpu_count: Optional[int] = attr.ib(default=None)
+    mem_limit: Optional[str] = attr.ib(default=None)
+    blkio_weight: Optional[int] = attr.ib(default=None)
+
+
 @attr.s
 class ContainerSpec:
     name: str = attr.ib()
     builds: List[str] = attr.ib()
     volume: Optional[VolumeSpec] = attr.ib(default=None)
     ports: Optional[str] = attr.ib(default="80,443")
+    resources: ResourceSpec = attr.ib(factory=ResourceSpec)
 
     def add_volume(self,
                    v_type: str,
@@ -38,6 +47,13 @@ class ContainerSpec:
     def add_ports(self, ports: str):
         self.ports = ports
 
+    def add_resources(self,
+                      cpu_set: Union[str, None] = None,
+                      cpu_count: Union[int, None] = None,
+                      mem_limit: Union[str, None] = None,
+                      blkio_weight: Union[int, None] = None):
+        self.resources = ResourceSpec(cpu_set, cpu_count, mem_limit, blkio_weight)
+
 
 @attr.s
 class ContainerSet:
@@ -79,6 +95,12 @@ class ContainerProfile(object):
                     profile = ContainerSpec(image, settings.get('builds').split(','))
                     if settings.get('ports'):
                         profile.add_ports(settings.get('ports'))
+                    if settings.get('resources'):
+                        res_spec = settings.get('resources')
+                        profile.add_resources(res_spec.get('cpu_set'),
+                                              res_spec.get('cpu_count'),
+                                              res_spec.get('mem_limit'),
+                                              res_spec.get('blkio_weight'))
                     if settings.get('volume'):
                         vol_spec = settings.get('volume')
                         profile.add_volume(vol_spec.get('type'),
@@ -0,0 +1,100 @@
+##
+##
+
+import logging
+import threading
+import time
+from typing import Callable, Any, List, Hashable
+from couchformation.exception import FatalError
+
+logger = logging.getLogger('couchformation.executor.batch')
+logger.addHandler(logging.NullHandler())
+
+
+class BatchError(FatalError):
+    pass
+
+
+class BatchRequest(object):
+    """Rendezvous for node threads that can be serviced by a single API call.
+
+    The first thread to submit for a key becomes the leader. It collects items until the expected count
+    is reached or no new item has arrived within the window, then calls the handler once with all items.
+    The handler must return a list of results in item order. The expected count should not exceed the number
+    of submitters that can run at the same time, otherwise every batch waits out the window.
+    """
+    _batches = {}
+    _lock = threading.Lock()
+
+    def __init__(self, key: Hashable, expected: int, window: float):
+        self.key = key
+        self.expected = expected
+        self.window = window
+        self.items = []
+        self.results = None
+        self.error = None
+        self.done = False
+        self.last = time.time()
+        self.cond = threading.Condition()
+
+    @classmethod
+    def submit(cls, key: Hashable, item: Any, handler: Callable[[List[Any]], List[Any]], expected: int = 1, window: float = 5.0) -> Any:
+        with cls._lock:
+            batch = cls._batches.get(key)
+            leader = batch is None
+            if leader:
+                batch = cls(key, expected, window)
+                cls._batches[key] = batch
+            with batch.cond:
+                index = len(batch.items)
+                batch.items.append(item)
+                batch.last = time.time()
+                if len(batch.items) >= batch.expected:
+                    cls._batches.pop(key, None)
+                batch.cond.notify_all()
+
+        if leader:
+            batch.run(handler)
+
+        return batch.result(index)
+
+    def close(self):
+        with self._lock:
+            if self._batches.get(self.key) is self:
+                del self._batches[self.key]
+
+    def run(self, handler: Callable[[List[Any]], List[Any]]):
+        with self.cond:
+            while len(self.items) < self.expected:
+                remaining = self.last + self.window - time.time()
+                if remaining <= 0:
+                    break
+                self.cond.wait(remaining)
+        self.close()
+
+        logger.debug(f"Batch {self.key}: processing {len(self.items)} item(s)")
+        try:
+            results = handler(list(self.items))
+            if len(results) != len(self.items):
+                raise BatchError(f"batch {self.key} returned {len(results)} results for {len(self.items)} items")
+        except BaseException as err:
+            results = None
+            error = err
+        else:
+            error = None
+
+        with self.cond:
+            self.results = results
+            self.error = error
+            self.done = True
+            self.cond.notify_all()
+
+    def result(self, index: int) -> Any:
+        with self.cond:
+            while not self.done:
+                self.cond.wait()
+        if isinstance(self.error, SystemExit):
+            raise SystemExit(self.error.code)
+        elif self.error:
+            raise BatchError(f"batch {self.key} failed: {self.error}")
+        return self.results[index]
@@ -3,6 +3,7 @@
 
 import logging
 import concurrent.futures
+from typing import Optional
 import couchformation.executor.worker as worker
 from couchformation.exception import NonFatalLogError
 
@@ -16,13 +17,18 @@ class TaskError(NonFatalLogError):
 
 class JobDispatch(object):
 
-    def __init__(self):
-        self.executor = concurrent.futures.ThreadPoolExecutor()
+    def __init__(self, max_workers: Optional[int] = None):
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
         self.tasks = set()
 
     def dispatch(self, *args, **kwargs):
         self.tasks.add(self.executor.submit(worker.main, *args, **kwargs))
 
+    def call(self, func, *args, **kwargs) -> concurrent.futures.Future:
+        task = self.executor.submit(func, *args, **kwargs)
+        self.tasks.add(task)
+        return task
+
     @staticmethod
     def foreground(*args, **kwargs):
         return worker.main(*args, **kwargs)
@@ -132,6 +132,7 @@ class Provisioner:
     when: str = attr.ib()
     options: List[str] = attr.ib()
     parameters: Dict = attr.ib()
+    commit: Optional[str] = attr.ib(default=None)
 
     def parameter_gen(self, *args):
         parameters = self.initialize_parameters(self.options, args)
@@ -393,7 +394,8 @@ class ProvisionerProfile(object):
         when = settings.get('when')
         options = settings.get('parameters')
         parameters = {}
-        return name, driver, module, method, upload, files, when, options, parameters
+        commit = settings.get('commit')
+        return name, driver, module, method, upload, files, when, options, parameters, commit
 
 
 class DeployStrategy(object):
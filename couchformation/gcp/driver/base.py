@@ -5,14 +5,18 @@ import os.path
 import socket
 import logging
 import json
-import time
 import base64
 import sqlite3
+import threading
+import httplib2
 import googleapiclient.discovery
 import googleapiclient.errors
+import googleapiclient.http
 import google.auth
 import google.auth.transport.requests
+import google_auth_httplib2
 from pathlib import Path
+from typing import List, Union, Callable
 from google.cloud import storage
 from google.oauth2 import service_account
 from google.cloud import resourcemanager_v3
@@ -40,6 +44,9 @@ class EmptyResultSet(NonFatalError):
 
 class CloudBase(object):
     cache = {}
+    clients = {}
+    zone_cache = {}
+    cache_lock = threading.RLock()
 
     def __init__(self, parameters: dict):
         self.parameters = parameters
@@ -72,12 +79,14 @@ class CloudBase(object):
                 self._service_account_email = CloudBase.cache.get('service_account_email')
                 self._user_account_email = CloudBase.cache.get('user_account_email')
         elif AuthMode[parameters.get('auth_mode')] == AuthMode.file:
-            self.credentials, self.gcp_project, self._service_account_email = self.file_auth()
+            if not CloudBase.cache.get('file_credentials'):
+                CloudBase.cache['file_credentials'] = self.file_auth()
+            self.credentials, self.gcp_project, self._service_account_email = CloudBase.cache.get('file_credentials')
         else:
             raise GCPDriverError(f"Unsupported auth mode {parameters.get('auth_mode')}")
 
-        self.gcp_client = googleapiclient.discovery.build('compute', 'v1', credentials=self.credentials)
-        self.dns_client = googleapiclient.discovery.build('dns', 'v1', credentials=self.credentials)
+        self.gcp_client = self.get_client('compute', 'v1')
+        self.dns_client = self.get_client('dns', 'v1')
 
         if not self.gcp_project:
             raise GCPDriverError(f"can not determine GCP project")
@@ -199,8 +208,27 @@ class CloudBase(object):
         file_handle.close()
         return auth_data
 
+    def get_client(self, service: str, version: str):
+        key = (service, version, id(self.credentials))
+        with CloudBase.cache_lock:
+            if key not in CloudBase.clients:
+                credentials = self.credentials
+
+                def request_builder(_http, *args, **kwargs):
+                    authorized_http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+                    return googleapiclient.http.HttpRequest(authorized_http, *args, **kwargs)
+
+                CloudBase.clients[key] = googleapiclient.discovery.build(service, version, credentials=credentials, requestBuilder=request_builder, cache_discovery=False)
+            return CloudBase.clients[key]
+
     @retry()
     def zones(self) -> list:
+        key = (self.gcp_project, self.gcp_region)
+        with CloudBase.cache_lock:
+            if CloudBase.zone_cache.get(key):
+                self.gcp_zone_list = list(CloudBase.zone_cache[key])
+                self.gcp_zone = self.gcp_zone_list[0]
+                return self.gcp_zone_list
         try:
             request = self.gcp_client.zones().list(project=self.gcp_project)
             while request is not None:
@@ -218,6 +246,9 @@ class CloudBase(object):
         if len(self.gcp_zone_list) == 0:
             raise GCPDriverError("can not get GCP availability zones")
 
+        with CloudBase.cache_lock:
+            CloudBase.zone_cache[key] = list(self.gcp_zone_list)
+
         self.gcp_zone = self.gcp_zone_list[0]
         return self.gcp_zone_list
 
@@ -245,6 +276,15 @@ class CloudBase(object):
     def account_email(self):
         return self._service_account_email if self._service_account_email else self._user_account_email
 
+    def list_filtered(self, collection: Callable, list_filter: str, **kwargs) -> List[dict]:
+        item_list = []
+        request = collection().list(project=self.gcp_project, filter=list_filter, **kwargs)
+        while request is not None:
+            response = request.execute()
+            item_list.extend(response.get('items', []))
+            request = collection().list_next(previous_request=request, previous_response=response)
+        return item_list
+
     @staticmethod
     def process_labels(struct: dict) -> dict:
         block = {}
@@ -254,43 +294,74 @@ class CloudBase(object):
         block = dict(sorted(block.items()))
         return block
 
-    def wait_for_global_operation(self, operation):
-        while True:
-            result = self.gcp_client.globalOperations().get(
-                project=self.gcp_project,
-                operation=operation).execute()
-
-            if result['status'] == 'DONE':
-                if 'error' in result:
-                    raise GCPDriverError(result['error'])
-                return result
+    @staticmethod
+    def operation_result(result: dict) -> Union[dict, None]:
+        if result['status'] == 'DONE':
+            if 'error' in result:
+                raise GCPDriverError(result['error'])
+            return result
+        return None
 
-            time.sleep(1)
+    def operation_request(self, operation: str, method: str, zone: str = None, region: str = None):
+        if zone:
+            return getattr(self.gcp_client.zoneOperations(), method)(project=self.gcp_project, zone=zone, operation=operation)
+        elif region:
+            return getattr(self.gcp_client.regionOperations(), method)(project=self.gcp_project, region=region, operation=operation)
+        else:
+            return getattr(self.gcp_client.globalOperations(), method)(project=self.gcp_project, operation=operation)
 
-    def wait_for_regional_operation(self, operation):
+    def operation_call(self, operation: str, method: str, zone: str = None, region: str = None) -> Union[dict, None]:
+        try:
+            return self.operation_request(operation, method, zone=zone, region=region).execute()
+        except (socket.timeout, TimeoutError):
+            logger.debug(f"Operation {operation} {method} timed out, retrying")
+            return None
+        except googleapiclient.errors.HttpError as err:
+            raise GCPDriverError(f"error getting operation {operation} status: {err}")
+
+    def wait_for_operation_call(self, operation: str, zone: str = None, region: str = None):
         while True:
-            result = self.gcp_client.regionOperations().get(
-                project=self.gcp_project,
-                region=self.gcp_region,
-                operation=operation).execute()
-
-            if result['status'] == 'DONE':
-                if 'error' in result:
-                    raise GCPDriverError(result['error'])
+            result = self.operation_call(operation, 'wait', zone=zone, region=region)
+            if result and self.operation_result(result):
                 return result
 
-            time.sleep(1)
+    def wait_for_global_operation(self, operation):
+        return self.wait_for_operation_call(operation)
+
+    def wait_for_regional_operation(self, operation, region: str = None):
+        return self.wait_for_operation_call(operation, region=region if region else self.gcp_region)
 
     def wait_for_zone_operation(self, operation, zone):
-        while True:
-            result = self.gcp_client.zoneOperations().get(
-                project=self.gcp_project,
-                zone=zone,
-                operation=operation).execute()
+        return self.wait_for_operation_call(operation, zone=zone)
 
-            if result['status'] == 'DONE':
+    @staticmethod
+    def operation_location(operation: dict) -> dict:
+        if operation.get('zone'):
+            return {'zone': operation['zone'].split('/')[-1]}
+        elif operation.get('region'):
+            return {'region': operation['region'].split('/')[-1]}
+        return {}
+
+    def wait_for_operation(self, operation: dict):
+        return self.wait_for_operation_call(operation['name'], **self.operation_location(operation))
+
+    def wait_for_operations(self, operations: List[dict]) -> List[dict]:
+        results = [None] * len(operations)
+        pending = dict(enumerate(operations))
+        errors = []
+
+        while pending:
+            first = next(iter(pending))
+            for n, operation in list(pending.items()):
+                result = self.operation_call(operation['name'], 'wait' if n == first else 'get', **self.operation_location(operation))
+                if not result or result['status'] != 'DONE':
+                    continue
+                del pending[n]
                 if 'error' in result:
-                    raise GCPDriverError(result['error'])
-                return result
+                    errors.append(result['error'])
+                else:
+                    results[n] = result
 
-            time.sleep(1)
+        if errors:
+            raise GCPDriverError(f"{len(errors)} of {len(operations)} operations failed: {errors[0]}")
+        return results
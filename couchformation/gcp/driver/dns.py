@@ -2,6 +2,7 @@
 ##
 
 import logging
+from typing import List, Tuple
 import googleapiclient.errors
 import googleapiclient.discovery
 from couchformation.gcp.driver.base import CloudBase, GCPDriverError
@@ -33,7 +34,7 @@ class DNS(CloudBase):
         if service_account:
             dns_client = googleapiclient.discovery.build('dns', 'v1', credentials=self.sa_auth(service_account))
         else:
-            dns_client = googleapiclient.discovery.build('dns', 'v1', credentials=self.credentials)
+            dns_client = self.dns_client
 
         if zone_name:
             name = zone_name
@@ -139,8 +140,8 @@ class DNS(CloudBase):
         except Exception as err:
             raise GCPDriverError(f"error deleting managed zone: {err}")
 
-    def add_record(self, managed_zone: str, name: str, values: list, record_type: str = 'A', ttl: int = 300):
-        dns_record_body = {
+    def record_set(self, name: str, values: list, record_type: str = 'A', ttl: int = 300) -> dict:
+        return {
             'kind': 'dns#resourceRecordSet',
             'name': self.fqdn(name),
             'rrdatas': values,
@@ -148,6 +149,9 @@ class DNS(CloudBase):
             'type': record_type
         }
 
+    def add_record(self, managed_zone: str, name: str, values: list, record_type: str = 'A', ttl: int = 300):
+        dns_record_body = self.record_set(name, values, record_type, ttl)
+
         try:
             request = self.dns_client.resourceRecordSets().create(project=self.gcp_project, managedZone=managed_zone, body=dns_record_body)
             request.execute()
@@ -160,3 +164,55 @@ class DNS(CloudBase):
             request.execute()
         except Exception as err:
             raise GCPDriverError(f"error deleting DNS records: {err}")
+
+    def add_records(self, managed_zone: str, records: List[Tuple[str, list]], record_type: str = 'A', ttl: int = 300):
+        change_body = {
+            'kind': 'dns#change',
+            'additions': [self.record_set(name, values, record_type, ttl) for name, values in records]
+        }
+
+        try:
+            request = self.dns_client.changes().create(project=self.gcp_project, managedZone=managed_zone, body=change_body)
+            request.execute()
+        except Exception as err:
+            raise GCPDriverError(f"error creating DNS records: {err}")
+
+    def list_records(self, managed_zone: str, record_type: str = 'A') -> dict:
+        records = {}
+        try:
+            request = self.dns_client.resourceRecordSets().list(project=self.gcp_project, managedZone=managed_zone)
+            while request is not None:
+                response = request.execute()
+                for resource_record_set in response.get('rrsets', []):
+                    if resource_record_set['type'] == record_type:
+                        records[resource_record_set['name']] = resource_record_set
+                request = self.dns_client.resourceRecordSets().list_next(previous_request=request, previous_response=response)
+            return records
+        except Exception as err:
+            raise GCPDriverError(f"error listing DNS records: {err}")
+
+    def delete_records(self, managed_zone: str, records: List[Tuple[str, list]], record_type: str = 'A'):
+        current = self.list_records(managed_zone, record_type)
+        deletions = []
+        for name, values in records:
+            record_set = current.get(self.fqdn(name))
+            if not record_set:
+                logger.warning(f"Record {name} not found in zone {managed_zone}")
+                continue
+            if sorted(record_set.get('rrdatas', [])) != sorted(values):
+                logger.debug(f"Record {name} has values {','.join(record_set.get('rrdatas', []))}, expected {','.join(values)}")
+            deletions.append(record_set)
+
+        if len(deletions) == 0:
+            return
+
+        change_body = {
+            'kind': 'dns#change',
+            'deletions': deletions
+        }
+
+        try:
+            request = self.dns_client.changes().create(project=self.gcp_project, managedZone=managed_zone, body=change_body)
+            request.execute()
+        except Exception as err:
+            raise GCPDriverError(f"error deleting DNS records: {err}")
@@ -36,6 +36,12 @@ class Firewall(CloudBase):
         else:
             return firewall_list
 
+    def list_by_prefix(self, prefix: str) -> List[dict]:
+        try:
+            return self.list_filtered(self.gcp_client.firewalls, f"name eq {prefix}.*")
+        except Exception as err:
+            raise GCPDriverError(f"error listing firewall rules: {err}")
+
     def search(self, pattern: str) -> List[dict]:
         firewall_list = []
         for entry in self.list():
@@ -43,8 +49,8 @@ class Firewall(CloudBase):
                 firewall_list.append(entry)
         return firewall_list
 
-    def create_ingress(self, name: str, network: str, cidr: str, protocol: str = "tcp", ports: Union[List[str], None] = None, udp_ports: Union[List[str], None] = None) -> str:
-        operation = {}
+    @staticmethod
+    def ingress_body(name: str, network: str, cidr: str, protocol: str = "tcp", ports: Union[List[str], None] = None, udp_ports: Union[List[str], None] = None) -> dict:
         firewall_body = {
             "sourceRanges": [
                 cidr,
@@ -66,30 +72,48 @@ class Firewall(CloudBase):
                 IPProtocol="udp",
                 ports=udp_ports
             ))
-        try:
-            request = self.gcp_client.firewalls().insert(project=self.gcp_project, body=firewall_body)
-            operation = request.execute()
-            self.wait_for_global_operation(operation['name'])
-        except googleapiclient.errors.HttpError as err:
-            error_details = err.error_details[0].get('reason')
-            if error_details != "alreadyExists":
-                raise GCPDriverError(f"can not create firewall rule: {err}")
-        except Exception as err:
-            raise GCPDriverError(f"error creating firewall rule: {err}")
+        return firewall_body
 
-        return operation.get('targetLink')
+    def create_ingress(self, name: str, network: str, cidr: str, protocol: str = "tcp", ports: Union[List[str], None] = None, udp_ports: Union[List[str], None] = None) -> str:
+        return self.create_ingress_rules([self.ingress_body(name, network, cidr, protocol, ports, udp_ports)])[0]
+
+    def create_ingress_rules(self, rules: List[dict]) -> List[str]:
+        operations = []
+        links = []
+        for firewall_body in rules:
+            try:
+                request = self.gcp_client.firewalls().insert(project=self.gcp_project, body=firewall_body)
+                operation = request.execute()
+                operations.append(operation)
+                links.append(operation.get('targetLink'))
+            except googleapiclient.errors.HttpError as err:
+                error_details = err.error_details[0].get('reason')
+                if error_details != "alreadyExists":
+                    raise GCPDriverError(f"can not create firewall rule: {err}")
+                links.append(None)
+            except Exception as err:
+                raise GCPDriverError(f"error creating firewall rule: {err}")
+
+        self.wait_for_operations(operations)
+        return links
 
     def delete(self, firewall: str) -> None:
-        try:
-            request = self.gcp_client.firewalls().delete(project=self.gcp_project, firewall=firewall)
-            operation = request.execute()
-            self.wait_for_global_operation(operation['name'])
-        except googleapiclient.errors.HttpError as err:
-            error_details = err.error_details[0].get('reason')
-            if error_details != "notFound":
-                raise GCPDriverError(f"can not delete firewall rule: {err}")
-        except Exception as err:
-            raise GCPDriverError(f"error deleting firewall rule: {err}")
+        self.delete_rules([firewall])
+
+    def delete_rules(self, firewalls: List[str]) -> None:
+        operations = []
+        for firewall in firewalls:
+            try:
+                request = self.gcp_client.firewalls().delete(project=self.gcp_project, firewall=firewall)
+                operations.append(request.execute())
+            except googleapiclient.errors.HttpError as err:
+                error_details = err.error_details[0].get('reason')
+                if error_details != "notFound":
+                    raise GCPDriverError(f"can not delete firewall rule: {err}")
+            except Exception as err:
+                raise GCPDriverError(f"error deleting firewall rule: {err}")
+
+        self.wait_for_operations(operations)
 
     def details(self, firewall: str) -> Union[dict, None]:
         try:
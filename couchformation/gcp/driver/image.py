@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import List, Union
 from couchformation.gcp.driver.base import CloudBase, GCPDriverError, EmptyResultSet
 from couchformation.gcp.driver.constants import GCPImageProjects
+from couchformation.resources.catalog import CatalogManager
 import couchformation.constants as C
 
 logger = logging.getLogger('couchformation.gcp.driver.image')
@@ -85,7 +86,20 @@ class Image(CloudBase):
         except Exception as err:
             raise GCPDriverError(f"error deleting image: {err}")
 
-    def list_standard(self, architecture: str = 'x86_64', os_id: str = None, os_version: str = None):
+    def list_standard(self, architecture: str = 'x86_64', os_id: str = None, os_version: str = None, refresh: bool = False):
+        catalog = CatalogManager('gcp')
+        catalog_key = f"image:{os_id}:{os_version}:{architecture}"
+        if not refresh:
+            cached = catalog.get(catalog_key)
+            if cached:
+                logger.debug(f"Selected cached image -> {cached}")
+                return cached
+        result = self._list_standard(architecture, os_id, os_version)
+        if result:
+            catalog.set(catalog_key, result)
+        return result
+
+    def _list_standard(self, architecture: str = 'x86_64', os_id: str = None, os_version: str = None):
         result_list = []
         for image_type in GCPImageProjects.projects:
             if os_id and image_type['os_id'] != os_id:
@@ -2,13 +2,14 @@
 ##
 
 import logging
+import re
 import base64
 import time
 import googleapiclient.errors
 import datetime
 import copy
 import json
-from typing import Union
+from typing import Union, List
 from couchformation.gcp.driver.base import CloudBase, GCPDriverError
 from couchformation.ssh import SSHUtil
 
@@ -36,13 +37,123 @@ class Instance(CloudBase):
             swap_disk,
             data_disk,
             root_size="256",
+            swap_size=None,
+            data_size=None,
             disk_type: str = "pd-ssd",
             machine_type="n2-standard-2",
             virtualization: bool = False):
         operation = {}
-        instance_body = {
+        instance_body = self.instance_properties(image_project, image_name, sa_email, zone, vpc, subnet, username, ssh_key,
+                                                 root_size=root_size, disk_type=disk_type, machine_type=machine_type, virtualization=virtualization)
+        instance_body.update({
             "name": name,
-            "zone": zone,
+            "zone": zone
+        })
+        instance_body["disks"].extend([
+            self.attached_disk(zone, swap_disk, swap_size, disk_type, device_name="swap"),
+            self.attached_disk(zone, data_disk, data_size, disk_type, device_name="data")
+        ])
+
+        try:
+            request = self.gcp_client.instances().insert(project=self.gcp_project, zone=zone, body=instance_body)
+            operation = request.execute()
+            self.wait_for_zone_operation(operation['name'], zone)
+        except googleapiclient.errors.HttpError as err:
+            error_details = err.error_details[0].get('reason')
+            if error_details != "alreadyExists":
+                raise GCPDriverError(f"can not create instance: {err}")
+        except Exception as err:
+            raise GCPDriverError(f"error creating instance: {err}")
+
+        return operation.get('targetLink')
+
+    def run_batch(self,
+                  names: List[str],
+                  image_project: str,
+                  image_name: str,
+                  sa_email: Union[str, None],
+                  zone: str,
+                  vpc: str,
+                  subnet: str,
+                  username: str,
+                  ssh_key: str,
+                  root_size="256",
+                  swap_size="16",
+                  data_size="256",
+                  disk_type: str = "pd-ssd",
+                  machine_type="n2-standard-2",
+                  virtualization: bool = False) -> List[dict]:
+        instance_properties = self.instance_properties(image_project, image_name, sa_email, zone, vpc, subnet, username, ssh_key,
+                                                       root_size=root_size, disk_type=disk_type, machine_type=machine_type,
+                                                       virtualization=virtualization, bulk=True)
+        instance_properties["disks"].extend([
+            self.attached_disk(zone, size=swap_size, disk_type=disk_type, device_name="swap", bulk=True),
+            self.attached_disk(zone, size=data_size, disk_type=disk_type, device_name="data", bulk=True)
+        ])
+
+        bulk_body = {
+            "count": len(names),
+            "minCount": len(names),
+            "perInstanceProperties": {name: {} for name in names},
+            "instanceProperties": instance_properties
+        }
+
+        try:
+            request = self.gcp_client.instances().bulkInsert(project=self.gcp_project, zone=zone, body=bulk_body)
+            operation = request.execute()
+            self.wait_for_zone_operation(operation['name'], zone)
+        except googleapiclient.errors.HttpError as err:
+            error_details = err.error_details[0].get('reason')
+            if error_details != "alreadyExists":
+                raise GCPDriverError(f"can not create instances: {err}")
+        except Exception as err:
+            raise GCPDriverError(f"error creating instances: {err}")
+
+        return self.wait_for_addresses(names, zone)
+
+    @staticmethod
+    def name_filter(names: List[str]) -> str:
+        return f'name eq "^({"|".join(re.escape(name) for name in names)})$"'
+
+    def list_by_name(self, names: List[str], zone: str) -> List[dict]:
+        try:
+            return self.list_filtered(self.gcp_client.instances, self.name_filter(names), zone=zone)
+        except Exception as err:
+            raise GCPDriverError(f"error listing instances: {err}")
+
+    def wait_for_addresses(self, names: List[str], zone: str, interval: float = 1.0, timeout: int = 300) -> List[dict]:
+        end_time = time.time() + timeout
+        while True:
+            instances = {instance['name']: instance for instance in self.list_by_name(names, zone)}
+            missing = [name for name in names if name not in instances]
+            if missing:
+                raise GCPDriverError(f"instances not found after create: {','.join(missing)}")
+            if all(instances[name]['networkInterfaces'][0].get('accessConfigs', [{}])[0].get('natIP') for name in names):
+                return [instances[name] for name in names]
+            if time.time() > end_time:
+                raise GCPDriverError(f"timeout waiting for instance addresses in zone {zone}")
+            time.sleep(interval)
+
+    @staticmethod
+    def attached_disk_name(instance: dict, device_name: str) -> Union[str, None]:
+        disk = next((d for d in instance.get('disks', []) if d.get('deviceName') == device_name), None)
+        return disk['source'].split('/')[-1] if disk else None
+
+    def instance_properties(self,
+                            image_project: str,
+                            image_name: str,
+                            sa_email: Union[str, None],
+                            zone: str,
+                            vpc: str,
+                            subnet: str,
+                            username: str,
+                            ssh_key: str,
+                            root_size="256",
+                            disk_type: str = "pd-ssd",
+                            machine_type="n2-standard-2",
+                            virtualization: bool = False,
+                            bulk: bool = False) -> dict:
+        instance_body = {
             "networkInterfaces": [
                 {
                     "network": f"projects/{self.gcp_project}/global/networks/{vpc}",
@@ -69,19 +180,13 @@ class Instance(CloudBase):
                     "boot": True,
                     "initializeParams": {
                         "sourceImage": f"projects/{image_project}/global/images/{image_name}",
-                        "diskType": f"zones/{zone}/diskTypes/{disk_type}",
+                        "diskType": disk_type if bulk else f"zones/{zone}/diskTypes/{disk_type}",
                         "diskSizeGb": str(round(float(root_size)))
                     },
                     "autoDelete": True
-                },
-                {
-                    "source": f"zones/{zone}/disks/{swap_disk}"
-                },
-                {
-                    "source": f"zones/{zone}/disks/{data_disk}"
                 }
             ],
-            "machineType": f"zones/{zone}/machineTypes/{machine_type}"
+            "machineType": machine_type if bulk else f"zones/{zone}/machineTypes/{machine_type}"
         }
 
         if virtualization:
@@ -103,18 +208,32 @@ class Instance(CloudBase):
                 ]
             })
 
-        try:
-            request = self.gcp_client.instances().insert(project=self.gcp_project, zone=zone, body=instance_body)
-            operation = request.execute()
-            self.wait_for_zone_operation(operation['name'], zone)
-        except googleapiclient.errors.HttpError as err:
-            error_details = err.error_details[0].get('reason')
-            if error_details != "alreadyExists":
-                raise GCPDriverError(f"can not create instance: {err}")
-        except Exception as err:
-            raise GCPDriverError(f"error creating instance: {err}")
+        return instance_body
 
-        return operation.get('targetLink')
+    @staticmethod
+    def attached_disk(zone: str,
+                      disk: Union[str, None] = None,
+                      size: Union[str, None] = None,
+                      disk_type: str = "pd-ssd",
+                      device_name: Union[str, None] = None,
+                      bulk: bool = False) -> dict:
+        if size is None:
+            attached = {
+                "source": f"zones/{zone}/disks/{disk}"
+            }
+        else:
+            attached = {
+                "initializeParams": {
+                    "diskType": disk_type if bulk else f"zones/{zone}/diskTypes/{disk_type}",
+                    "diskSizeGb": str(round(float(size)))
+                },
+                "autoDelete": True
+            }
+            if disk:
+                attached["initializeParams"]["diskName"] = disk
+        if device_name:
+            attached["deviceName"] = device_name
+        return attached
 
     def details(self, instance: str, zone: str) -> Union[dict, None]:
         try:
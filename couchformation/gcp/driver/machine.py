@@ -4,6 +4,7 @@
 import logging
 from couchformation.gcp.driver.base import CloudBase, GCPDriverError, EmptyResultSet
 from couchformation.gcp.driver.constants import ComputeTypes
+from couchformation.resources.catalog import CatalogManager
 import couchformation.constants as C
 
 logger = logging.getLogger('couchformation.gcp.driver.machine')
@@ -16,7 +17,18 @@ class MachineType(CloudBase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def list(self, zone: str, architecture: str = 'x86_64') -> list:
+    def list(self, zone: str, architecture: str = 'x86_64', refresh: bool = False) -> list:
+        catalog = CatalogManager('gcp')
+        catalog_key = f"machine:{zone}:{architecture}"
+        if not refresh:
+            cached = catalog.get(catalog_key)
+            if cached:
+                return cached
+        machine_type_list = self._list(zone, architecture)
+        catalog.set(catalog_key, machine_type_list)
+        return machine_type_list
+
+    def _list(self, zone: str, architecture: str = 'x86_64') -> list:
         machine_type_list = []
         if architecture == 'arm64':
             filter_string = "cpuPlatform = \"Ampere Altra\""
@@ -48,6 +48,12 @@ class Network(CloudBase):
         else:
             return network_list
 
+    def list_by_prefix(self, prefix: str) -> List[dict]:
+        try:
+            return self.list_filtered(self.gcp_client.networks, f"name eq {prefix}.*")
+        except Exception as err:
+            raise GCPDriverError(f"error listing networks: {err}")
+
     @property
     def cidr_list(self):
         try:
@@ -174,6 +180,26 @@ class Subnet(CloudBase):
         else:
             return subnet_list
 
+    def list_by_prefix(self, prefix: str) -> List[dict]:
+        subnet_list = []
+
+        try:
+            subnets = self.list_filtered(self.gcp_client.subnetworks, f"name eq {prefix}.*", region=self.gcp_region)
+        except Exception as err:
+            raise GCPDriverError(f"error listing subnets: {err}")
+
+        for subnet in subnets:
+            subnet_block = {'cidr': subnet['ipCidrRange'],
+                            'name': subnet['name'],
+                            'description': subnet.get('description', None),
+                            'gateway': subnet['gatewayAddress'],
+                            'network': subnet['network'].rsplit('/', 1)[-1],
+                            'region': subnet['region'].rsplit('/', 1)[-1],
+                            'id': subnet['id']}
+            subnet_list.append(subnet_block)
+
+        return subnet_list
+
     def create(self, name: str, network: str, cidr: str) -> str:
         operation = {}
         network_info = Network(self.parameters).details(network)
@@ -75,103 +75,69 @@ class GCPNetwork(object):
             self.peer_managed_zone_name = f"cf-{peer_name_part}-zone"
 
     def check_state(self):
-        if self.state.get('firewall_win'):
-            result = Firewall(self.parameters).details(self.state['firewall_win'])
-            if result is None:
-                logger.warning(f"Removing stale state entry for firewall entry {self.state['firewall_win']}")
-                del self.state['firewall_win']
-        else:
-            result = Firewall(self.parameters).details(self.firewall_win)
-            if result:
-                logger.warning(f"Importing orphaned entry for firewall rule {self.firewall_win}")
-                self.state['firewall_win'] = self.firewall_win
-
-        if self.state.get('firewall_ssh'):
-            result = Firewall(self.parameters).details(self.state['firewall_ssh'])
-            if result is None:
-                logger.warning(f"Removing stale state entry for firewall entry {self.state['firewall_ssh']}")
-                del self.state['firewall_ssh']
-        else:
-            result = Firewall(self.parameters).details(self.firewall_ssh)
-            if result:
-                logger.warning(f"Importing orphaned entry for firewall rule {self.firewall_ssh}")
-                self.state['firewall_ssh'] = self.firewall_ssh
-
+        firewalls = {fw['name']: fw for fw in Firewall(self.parameters).list_by_prefix(self.vpc_name)}
+        subnets = {subnet['name']: subnet for subnet in Subnet(self.parameters).list_by_prefix(self.asset_prefix)}
+        networks = {network['name']: network for network in Network(self.parameters).list_by_prefix(self.asset_prefix)}
+
+        firewall_keys = {
+            'firewall_win': self.firewall_win,
+            'firewall_ssh': self.firewall_ssh,
+            'firewall_default': self.firewall_default
+        }
         for build_port_cfg in self.build_ports:
-            build_name = build_port_cfg.build
-            state_key_name = f"firewall_{build_name}"
-            build_fw_name = f"{self.vpc_name}-fw-{build_name}"
+            firewall_keys[f"firewall_{build_port_cfg.build}"] = f"{self.vpc_name}-fw-{build_port_cfg.build}"
+
+        for state_key_name, fw_name in firewall_keys.items():
             if self.state.get(state_key_name):
-                result = Firewall(self.parameters).details(self.state[state_key_name])
-                if result is None:
+                if self.state[state_key_name] not in firewalls:
                     logger.warning(f"Removing stale state entry for firewall entry {self.state[state_key_name]}")
                     del self.state[state_key_name]
-            else:
-                result = Firewall(self.parameters).details(build_fw_name)
-                if result:
-                    logger.warning(f"Importing orphaned entry for firewall rule {build_fw_name}")
-                    self.state[state_key_name] = build_fw_name
+            elif fw_name in firewalls:
+                logger.warning(f"Importing orphaned entry for firewall rule {fw_name}")
+                self.state[state_key_name] = fw_name
 
         for group_sg_key in self.state.key_match('firewall_.*_group_.*'):
-            if self.state.get(group_sg_key):
-                result = Firewall(self.parameters).details(self.state[group_sg_key])
-                if result is None:
-                    logger.warning(f"Removing stale state entry for firewall entry {self.state[group_sg_key]}")
-                    del self.state[group_sg_key]
-        for fw_entry in Firewall(self.parameters).search(f"{self.vpc_name}-fw-.*-[0-9]*"):
-            m = re.search(f"{self.vpc_name}-fw-(.+?)-(.+?)", fw_entry['name'])
+            if self.state.get(group_sg_key) and self.state[group_sg_key] not in firewalls:
+                logger.warning(f"Removing stale state entry for firewall entry {self.state[group_sg_key]}")
+                del self.state[group_sg_key]
+        for fw_name in firewalls:
+            m = re.search(f"{self.vpc_name}-fw-(.+?)-(.+?)", fw_name)
+            if not m:
+                continue
             state_key_name = f"firewall_{m.group(1)}_group_{m.group(2)}"
             if not self.state.get(state_key_name):
-                logger.warning(f"Importing orphaned entry for firewall rule {fw_entry['name']}")
-                self.state[state_key_name] = fw_entry['name']
-
-        if self.state.get('firewall_default'):
-            result = Firewall(self.parameters).details(self.state['firewall_default'])
-            if result is None:
-                logger.warning(f"Removing stale state entry for firewall entry {self.state['firewall_default']}")
-                del self.state['firewall_default']
-        else:
-            result = Firewall(self.parameters).details(self.firewall_default)
-            if result:
-                logger.warning(f"Importing orphaned entry for firewall rule {self.firewall_default}")
-                self.state['firewall_default'] = self.firewall_default
+                logger.warning(f"Importing orphaned entry for firewall rule {fw_name}")
+                self.state[state_key_name] = fw_name
 
         if self.state.get('subnet'):
-            result = Subnet(self.parameters).details(self.state['subnet'])
-            if result is None:
+            if self.state['subnet'] not in subnets:
                 logger.warning(f"Removing stale state entry for subnet {self.state['subnet']}")
                 del self.state['subnet']
                 del self.state['subnet_cidr']
-        else:
-            result = Subnet(self.parameters).details(self.subnet_name)
-            if result:
-                logger.warning(f"Importing orphaned entry for subnet {self.subnet_name}")
-                self.state['subnet'] = self.subnet_name
-                self.state['subnet_cidr'] = result['cidr']
+        elif self.subnet_name in subnets:
+            logger.warning(f"Importing orphaned entry for subnet {self.subnet_name}")
+            self.state['subnet'] = self.subnet_name
+            self.state['subnet_cidr'] = subnets[self.subnet_name]['cidr']
 
         if self.state.get('network'):
-            result = Network(self.parameters).details(self.state['network'])
-            if result is None:
+            if self.state['network'] not in networks:
                 logger.warning(f"Removing stale state entry for network {self.state['network']}")
                 del self.state['network']
                 del self.state['network_cidr']
                 del self.state['zone']
-        else:
-            result = Network(self.parameters).details(self.vpc_name)
-            if result:
-                logger.warning(f"Importing orphaned entry for network {self.vpc_name}")
-                self.state['network'] = self.vpc_name
-                self.state['network_link'] = result['selfLink']
+        elif self.vpc_name in networks:
+            logger.warning(f"Importing orphaned entry for network {self.vpc_name}")
+            self.state['network'] = self.vpc_name
+            self.state['network_link'] = networks[self.vpc_name]['selfLink']
+
+        if self.state.get('public_hosted_zone') or self.state.get('private_hosted_zone'):
+            managed_zones = [zone['name'] for zone in DNS(self.parameters).list_zones()]
 
-        if self.state.get('public_hosted_zone'):
-            result = DNS(self.parameters).details(self.state['public_hosted_zone'])
-            if result is None:
+            if self.state.get('public_hosted_zone') and self.state['public_hosted_zone'] not in managed_zones:
                 logger.warning(f"Removing stale state entry for public managed zone {self.state['public_hosted_zone']}")
                 del self.state['public_hosted_zone']
 
-        if self.state.get('private_hosted_zone'):
-            result = DNS(self.parameters).details(self.state['private_hosted_zone'])
-            if result is None:
+            if self.state.get('private_hosted_zone') and self.state['private_hosted_zone'] not in managed_zones:
                 logger.warning(f"Removing stale state entry for private managed zone {self.state['private_hosted_zone']}")
                 del self.state['private_hosted_zone']
 
@@ -229,15 +195,16 @@ class GCPNetwork(object):
                 self.state['subnet'] = self.subnet_name
                 logger.info(f"Created subnet {self.subnet_name}")
 
+            firewall_rules = {}
             if not self.state.get('firewall_default'):
-                Firewall(self.parameters).create_ingress(self.firewall_default, self.vpc_name, vpc_cidr, "all")
-                self.state['firewall_default'] = self.firewall_default
-                logger.info(f"Created firewall rule {self.firewall_default}")
-
+                firewall_rules['firewall_default'] = Firewall.ingress_body(self.firewall_default, self.vpc_name, vpc_cidr, "all")
             if not self.state.get('firewall_ssh'):
-                Firewall(self.parameters).create_ingress(self.firewall_ssh, self.vpc_name, "0.0.0.0/0", "tcp", ["22"])
-                self.state['firewall_ssh'] = self.firewall_ssh
-                logger.info(f"Created firewall rule {self.firewall_ssh}")
+                firewall_rules['firewall_ssh'] = Firewall.ingress_body(self.firewall_ssh, self.vpc_name, "0.0.0.0/0", "tcp", ["22"])
+
+            Firewall(self.parameters).create_ingress_rules(list(firewall_rules.values()))
+            for state_key_name, firewall_body in firewall_rules.items():
+                self.state[state_key_name] = firewall_body['name']
+                logger.info(f"Created firewall rule {firewall_body['name']}")
 
             for n, zone in enumerate(zone_list):
                 if self.state.list_exists('zone', zone):
@@ -280,44 +247,51 @@ class GCPNetwork(object):
         except Exception as err:
             raise GCPNetworkError(f"Error creating network: {err}")
 
-    @synchronize()
     def create_build_sg(self, build_name: str):
+        self.create_node_sgs(build_name=build_name)
+
+    def create_win_sg(self):
+        self.create_node_sgs(windows=True)
+
+    def create_node_group_sg(self, service: str, group: int, ports: List[str]):
+        self.create_node_sgs(service=service, group=group, ports=ports)
+
+    @synchronize()
+    def create_node_sgs(self, build_name: str = None, service: str = None, group: int = None, ports: List[str] = None, windows: bool = False):
         vpc_name = self.vpc_name
+        rules = {}
+
         for build_port_cfg in self.build_ports:
             if build_port_cfg.build != build_name:
                 continue
             state_key_name = f"firewall_{build_name}"
-            build_fw_name = f"{vpc_name}-fw-{build_name}"
             if not self.state.get(state_key_name):
-                Firewall(self.parameters).create_ingress(build_fw_name, vpc_name, self.allow,
-                                                         ports=list(build_port_cfg.tcp_as_ranges()),
-                                                         udp_ports=list(build_port_cfg.udp_as_ranges()))
-                self.state[state_key_name] = build_fw_name
-                logger.info(f"Created firewall rule {build_fw_name}")
+                rules[state_key_name] = Firewall.ingress_body(f"{vpc_name}-fw-{build_name}", vpc_name, self.allow,
+                                                              ports=list(build_port_cfg.tcp_as_ranges()),
+                                                              udp_ports=list(build_port_cfg.udp_as_ranges()))
 
-    @synchronize()
-    def create_win_sg(self):
-        vpc_name = self.vpc_name
-        if not self.state.get('firewall_win'):
-            win_fw_name = f"{self.vpc_name}-fw-win"
-            Firewall(self.parameters).create_ingress(win_fw_name, vpc_name, self.allow, "tcp", [
+        if service and ports:
+            state_key_name = f"firewall_{service}_group_{group}"
+            if not self.state.get(state_key_name):
+                port_cfg = PortSettings().create(self.name, ports)
+                rules[state_key_name] = Firewall.ingress_body(f"{vpc_name}-fw-{service}-{group}", vpc_name, self.allow,
+                                                              ports=list(port_cfg.tcp_as_ranges()),
+                                                              udp_ports=list(port_cfg.udp_as_ranges()))
+
+        if windows and not self.state.get('firewall_win'):
+            rules['firewall_win'] = Firewall.ingress_body(f"{vpc_name}-fw-win", vpc_name, self.allow, "tcp", [
                 "3389",
                 "5985",
                 "5986"
             ])
-            self.state['firewall_win'] = win_fw_name
-            logger.info(f"Created firewall rule {win_fw_name}")
 
-    @synchronize()
-    def create_node_group_sg(self, service: str, group: int, ports: List[str]):
-        vpc_name = self.vpc_name
-        state_key_name = f"firewall_{service}_group_{group}"
-        build_fw_name = f"{vpc_name}-fw-{service}-{group}"
-        if not self.state.get(state_key_name):
-            port_cfg = PortSettings().create(self.name, ports)
-            Firewall(self.parameters).create_ingress(build_fw_name, vpc_name, self.allow, ports=list(port_cfg.tcp_as_ranges()), udp_ports=list(port_cfg.udp_as_ranges()))
-            self.state[state_key_name] = build_fw_name
-            logger.info(f"Created firewall rule {build_fw_name}")
+        if len(rules) == 0:
+            return
+
+        Firewall(self.parameters).create_ingress_rules(list(rules.values()))
+        for state_key_name, firewall_body in rules.items():
+            self.state[state_key_name] = firewall_body['name']
+            logger.info(f"Created firewall rule {firewall_body['name']}")
 
     @synchronize()
     def peer_vpc(self):
@@ -354,39 +328,17 @@ class GCPNetwork(object):
         try:
             self.state['state'] = State.DESTROYING.value
 
-            if self.state.get('firewall_win'):
-                firewall_win = self.state.get('firewall_win')
-                Firewall(self.parameters).delete(firewall_win)
-                del self.state['firewall_win']
-                logger.info(f"Removed firewall rule {firewall_win}")
-
-            if self.state.get('firewall_ssh'):
-                firewall_ssh = self.state.get('firewall_ssh')
-                Firewall(self.parameters).delete(firewall_ssh)
-                del self.state['firewall_ssh']
-                logger.info(f"Removed firewall rule {firewall_ssh}")
-
-            for build_port_cfg in self.build_ports:
-                build_name = build_port_cfg.build
-                state_key_name = f"firewall_{build_name}"
-                if self.state.get(state_key_name):
-                    firewall_rule = self.state.get(state_key_name)
-                    Firewall(self.parameters).delete(firewall_rule)
-                    del self.state[state_key_name]
-                    logger.info(f"Removing firewall rule {firewall_rule}")
-
-            for group_sg_key in self.state.key_match('firewall_.*_group_.*'):
-                if self.state.get(group_sg_key):
-                    firewall_rule = self.state.get(group_sg_key)
-                    Firewall(self.parameters).delete(firewall_rule)
-                    del self.state[group_sg_key]
-                    logger.info(f"Removing firewall rule {firewall_rule}")
-
-            if self.state.get('firewall_default'):
-                firewall_default = self.state.get('firewall_default')
-                Firewall(self.parameters).delete(firewall_default)
-                del self.state['firewall_default']
-                logger.info(f"Removed firewall rule {firewall_default}")
+            firewall_keys = ['firewall_win', 'firewall_ssh']
+            firewall_keys.extend([f"firewall_{build_port_cfg.build}" for build_port_cfg in self.build_ports])
+            firewall_keys.extend(self.state.key_match('firewall_.*_group_.*'))
+            firewall_keys.append('firewall_default')
+            firewall_keys = [key for key in firewall_keys if self.state.get(key)]
+
+            Firewall(self.parameters).delete_rules([self.state.get(key) for key in firewall_keys])
+            for key in firewall_keys:
+                firewall_rule = self.state.get(key)
+                del self.state[key]
+                logger.info(f"Removed firewall rule {firewall_rule}")
 
             if self.state.get('subnet'):
                 subnet_name = self.state.get('subnet')
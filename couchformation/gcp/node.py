@@ -2,8 +2,9 @@
 ##
 
 import re
+import json
 import logging
-import time
+from typing import List, Tuple
 from itertools import cycle, islice
 from couchformation.gcp.driver.base import CloudBase
 from couchformation.gcp.driver.instance import Instance
@@ -13,6 +14,7 @@ from couchformation.gcp.driver.image import Image
 from couchformation.gcp.driver.dns import DNS
 from couchformation.gcp.network import GCPNetwork
 from couchformation.deployment import MetadataManager
+from couchformation.executor.batch import BatchRequest
 from couchformation.config import get_state_file, get_state_dir, PortSettingSet, State
 from couchformation.ssh import SSHUtil
 from couchformation.exception import FatalError
@@ -51,6 +53,7 @@ class GCPDeployment(object):
         self.ports = parameters.get('ports')
         self.volume_size = parameters.get('volume_size') if parameters.get('volume_size') else "256"
         self.services = parameters.get('services') if parameters.get('services') else "default"
+        self.quantity = int(parameters.get('quantity')) if parameters.get('quantity') else 1
 
         project_uid = MetadataManager(self.project).project_uid
         self.asset_prefix = f"cf-{project_uid}"
@@ -59,8 +62,6 @@ class GCPDeployment(object):
         self.data_disk = f"{self.name}-data-{self.number:02d}"
         node_code = UUIDGen().text_hash(self.node_name)
         self.node_encoded = f"{self.asset_prefix}-{node_code}-node"
-        self.swap_encoded = f"{self.asset_prefix}-{node_code}-swap"
-        self.data_encoded = f"{self.asset_prefix}-{node_code}-data"
 
         cm = ConfigurationManager()
         if cm.get('ssh.key') and not self.ssh_key:
@@ -163,41 +164,29 @@ class GCPDeployment(object):
         else:
             virtualization = False
 
-        if self.ports:
-            self.gcp_network.create_node_group_sg(self.name, self.group, self.ports.split(','))
-            logger.info("Requesting service group firewall rule")
-
         build_ports = PortSettingSet().create().get(self.build)
-        if build_ports:
-            self.gcp_network.create_build_sg(self.build)
-            logger.info(f"Requesting build {self.build} firewall rule")
-
-        if image['os_id'] == 'windows':
-            self.gcp_network.create_win_sg()
-            logger.info("Requesting windows firewall rule")
-
-        logger.info(f"Creating disk {self.swap_encoded} ({self.swap_disk})")
-        Disk(self.parameters).create(self.swap_encoded, subnet['zone'], machine_ram)
-        self.state['swap_disk'] = self.swap_encoded
-
-        logger.info(f"Creating disk {self.data_encoded} ({self.data_disk})")
-        Disk(self.parameters).create(self.data_encoded, subnet['zone'], volume_size)
-        self.state['data_disk'] = self.data_encoded
+        self.gcp_network.create_node_sgs(build_name=self.build if build_ports else None,
+                                         service=self.name,
+                                         group=self.group,
+                                         ports=self.ports.split(',') if self.ports else None,
+                                         windows=image['os_id'] == 'windows')
+        logger.info("Requesting node firewall rules")
 
         logger.info(f"Creating node {self.node_encoded} ({self.node_name})")
-        Instance(self.parameters).run(self.node_encoded,
-                                      image['image_project'],
-                                      image['name'],
-                                      self.service_account_email,
-                                      subnet['zone'],
-                                      vpc_name,
-                                      subnet_name,
-                                      image['os_user'],
-                                      ssh_pub_key_text,
-                                      self.swap_encoded,
-                                      self.data_encoded,
-                                      machine_type=machine_name,
-                                      virtualization=virtualization)
+        launch_spec = dict(image_project=image['image_project'],
+                           image_name=image['name'],
+                           sa_email=self.service_account_email,
+                           zone=subnet['zone'],
+                           vpc=vpc_name,
+                           subnet=subnet_name,
+                           username=image['os_user'],
+                           ssh_key=ssh_pub_key_text,
+                           swap_size=machine_ram,
+                           data_size=volume_size,
+                           machine_type=machine_name,
+                           virtualization=virtualization)
+        batch_key = (self.project, self.name, self.group, 'launch')
+        instance_details = BatchRequest.submit(batch_key, (self.node_encoded, launch_spec), self.launch_batch, expected=self.quantity)
 
         self.state['instance_id'] = self.node_encoded
         self.state['name'] = self.node_encoded
@@ -205,26 +194,23 @@ class GCPDeployment(object):
         self.state['zone'] = subnet['zone']
         self.gcp_network.add_service(self.node_name)
 
-        while True:
-            try:
-                instance_details = Instance(self.parameters).details(self.node_encoded, subnet['zone'])
-                self.state['public_ip'] = instance_details['networkInterfaces'][0]['accessConfigs'][0]['natIP']
-                self.state['private_ip'] = instance_details['networkInterfaces'][0]['networkIP']
-                break
-            except KeyError:
-                time.sleep(1)
-            except TypeError:
-                raise GCPNodeError(f"Failed to properly start node {self.node_encoded} - try removing and recreating service")
+        try:
+            self.state['public_ip'] = instance_details['networkInterfaces'][0]['accessConfigs'][0]['natIP']
+            self.state['private_ip'] = instance_details['networkInterfaces'][0]['networkIP']
+            self.state['swap_disk'] = Instance.attached_disk_name(instance_details, "swap")
+            self.state['data_disk'] = Instance.attached_disk_name(instance_details, "data")
+        except (KeyError, IndexError, TypeError):
+            raise GCPNodeError(f"Failed to properly start node {self.node_encoded} - try removing and recreating service")
 
         if self.gcp_network.public_zone and self.gcp_network.domain_name and not self.state.get('public_hostname'):
             host_name = f"{self.node_name}.{self.gcp_network.domain_name}"
-            DNS(self.parameters).add_record(self.gcp_network.public_zone, host_name, [self.state['public_ip']])
+            self.dns_batch('add', self.gcp_network.public_zone, host_name, [self.state['public_ip']])
             self.state['public_zone_id'] = self.gcp_network.public_zone
             self.state['public_hostname'] = host_name
 
         if self.gcp_network.private_zone and self.gcp_network.domain_name and not self.state.get('private_hostname'):
             host_name = f"{self.node_name}.{self.gcp_network.domain_name}"
-            DNS(self.parameters).add_record(self.gcp_network.private_zone, host_name, [self.state['private_ip']])
+            self.dns_batch('add', self.gcp_network.private_zone, host_name, [self.state['private_ip']])
             self.state['private_zone_id'] = self.gcp_network.private_zone
             self.state['private_hostname'] = host_name
 
@@ -240,19 +226,47 @@ class GCPDeployment(object):
         self.state['state'] = State.DEPLOYED.value
         return self.state.as_dict
 
+    def launch_batch(self, requests: List[Tuple[str, dict]]) -> List[dict]:
+        launch_sets = {}
+        for n, (name, launch_spec) in enumerate(requests):
+            spec_key = json.dumps(launch_spec, sort_keys=True, default=str)
+            launch_sets.setdefault(spec_key, []).append(n)
+
+        instances = [None] * len(requests)
+        for index_list in launch_sets.values():
+            names = [requests[n][0] for n in index_list]
+            launch_spec = requests[index_list[0]][1]
+            logger.info(f"Launching {len(names)} instance(s) in zone {launch_spec['zone']}")
+            for n, instance in zip(index_list, Instance(self.parameters).run_batch(names, **launch_spec)):
+                instances[n] = instance
+
+        return instances
+
+    def dns_batch(self, action: str, managed_zone: str, name: str, values: list):
+        def handler(records: List[Tuple[str, list]]):
+            logger.info(f"Submitting {len(records)} DNS record change(s) to zone {managed_zone}")
+            if action == 'add':
+                DNS(self.parameters).add_records(managed_zone, records)
+            else:
+                DNS(self.parameters).delete_records(managed_zone, records)
+            return [True] * len(records)
+
+        batch_key = (self.project, self.name, self.group, 'dns', action, managed_zone)
+        return BatchRequest.submit(batch_key, (name, values), handler, expected=self.quantity)
+
     def destroy(self):
         self.state['state'] = State.DESTROYING.value
         if self.state.get('public_hostname'):
             domain_id = self.state['public_zone_id']
             name = self.state['public_hostname']
             ip = self.state['public_ip']
-            DNS(self.parameters).delete_record(domain_id, name)
+            self.dns_batch('delete', domain_id, name, [ip])
             logger.info(f"Deleted DNS record for {ip}")
         if self.state.get('private_hostname'):
             domain_id = self.state['private_zone_id']
             name = self.state['private_hostname']
             ip = self.state['private_ip']
-            DNS(self.parameters).delete_record(domain_id, name)
+            self.dns_batch('delete', domain_id, name, [ip])
             logger.info(f"Deleted DNS record for {ip}")
         if self.state.get('instance_id'):
             instance_name = self.state['instance_id']
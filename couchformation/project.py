@@ -50,6 +50,8 @@ class Project(object):
     def deploy(self, service=None, skip_provision=False):
         password = NodeGroup(self.options).create_credentials()
         private_key, ca_cert = NodeGroup(self.options).create_ca()
+        saas_runner = JobDispatch()
+        saas_tasks = {}
         for group in NodeGroup(self.options).get_node_groups():
             self._test_cloud(group)
         for group in NodeGroup(self.options).get_node_groups():
@@ -58,11 +60,18 @@ class Project(object):
             strategy = self.strategy.get(group[0].get('build'))
             cloud = group[0].get('cloud')
             region = group[0].get('region') if group[0].get('region') else "local"
+            depends = saas_tasks.get(group[0].get('connect'))
             if strategy.deployer == DeployMode.node.value:
+                for name, task in saas_tasks.items():
+                    self._check_saas(name, task, wait=False)
+                if depends:
+                    self._check_saas(group[0].get('connect'), depends)
                 self._deploy_network(cloud, region)
                 self._deploy_node(group, password, private_key, ca_cert, skip_provision)
             elif strategy.deployer == DeployMode.saas.value:
-                self._deploy_saas(group, password)
+                saas_tasks[group[0].get('name')] = saas_runner.call(self._deploy_saas, group, password, depends)
+        for name, task in saas_tasks.items():
+            self._check_saas(name, task)
 
     def destroy(self, service=None):
         for group in NodeGroup(self.options).get_node_groups():
@@ -159,7 +168,22 @@ class Project(object):
         method = profile.network.peer
         runner.foreground(module, instance, method, profile.merge_options(net.as_dict))
 
-    def _deploy_saas(self, group, password):
+    @staticmethod
+    def _check_saas(name, task, wait=True):
+        if not wait and not task.done():
+            return
+        try:
+            task.result()
+        except Exception as err:
+            raise ProjectError(f"Service {name} deployment failed: {err}")
+        except SystemExit:
+            raise ProjectError(f"Service {name} deployment failed")
+
+    def _deploy_saas(self, group, password, depends=None):
+        if depends:
+            logger.info(f"Service {group[0].get('name')} waiting for {group[0].get('connect')}")
+            self._check_saas(group[0].get('connect'), depends)
+
         runner = JobDispatch()
         cloud = group[0].get('cloud')
         profile = TargetProfile(self.remainder).get(cloud)
@@ -190,9 +214,91 @@ class Project(object):
 
         runner.foreground(module, instance, deploy, main_params)
 
+    @staticmethod
+    def group_size(group) -> int:
+        return sum(int(db['quantity']) if db['quantity'] else 1 for db in group)
+
+    @staticmethod
+    def _node_results(result_list, password):
+        result_list = sorted(result_list, key=lambda d: d['name'])
+        private_ip_list = [d['private_ip'] for d in result_list]
+        public_ip_list = [d['public_ip'] for d in result_list]
+        private_host_list = [d['private_hostname'] for d in result_list if d.get('private_hostname')]
+        public_host_list = [d['public_hostname'] for d in result_list if d.get('public_hostname')]
+        service_list = [d['services'] for d in result_list if d.get('services', 'default')]
+        result_list = [dict(item,
+                            private_ip_list=private_ip_list,
+                            public_ip_list=public_ip_list,
+                            private_host_list=private_host_list,
+                            public_host_list=public_host_list,
+                            service_list=service_list) for item in result_list]
+        return [dict(item, password=password) if 'password' not in item else item for item in result_list]
+
+    @staticmethod
+    def _upload(group, provisioner_name, result_list, runner):
+        if not group[0].get('upload') or not result_list:
+            return
+        provisioner = ProvisionerProfile().get(provisioner_name)
+        p_module = provisioner.driver
+        p_instance = provisioner.module
+        p_upload = provisioner.upload
+        p_list = [provisioner.parameter_gen(result, group[0].as_dict) for result in result_list]
+        for p_set in p_list:
+            logger.info(f"Uploading file {p_set.get('upload')}")
+            runner.dispatch(p_module, p_instance, p_upload, p_set)
+        exit_codes = list(runner.join())
+        if any(n != 0 for n in exit_codes):
+            raise ProjectError(f"Provisioning step failed")
+
+    @staticmethod
+    def _provision_default(group, provisioner_name, result_list, runner):
+        default_seq = BuildProfile().get('default')
+
+        for build_config in default_seq.get(provisioner_name):
+            if group[0].get('os_id') in build_config.exclude:
+                continue
+            provisioner = ProvisionerProfile().get(build_config.provisioner)
+            p_module = provisioner.driver
+            p_instance = provisioner.module
+            p_method = provisioner.method
+            p_list = [provisioner.parameter_gen(result, group[0].as_dict) for result in result_list]
+            for step, command in enumerate(build_config.commands):
+                for p_set in p_list:
+                    logger.info(f"Provisioning node {p_set.get('name')} - default step #{step + 1}")
+                    runner.dispatch(p_module, p_instance, p_method, p_set, command, build_config.root)
+                exit_codes = list(runner.join())
+                if any(n != 0 for n in exit_codes):
+                    raise ProjectError(f"Provisioning step failed")
+
+    def _deploy_cache_node(self, group, node, password):
+        module, instance, method, parameters = node
+        runner = JobDispatch()
+        logger.info(f"Deploying service {parameters.get('name')} node group {parameters.get('group')} node {parameters['number']} (image cache)")
+        result = runner.foreground(module, instance, method, parameters)
+        if not result:
+            raise ProjectError(f"Partial deployment: node {parameters['number']} failed")
+        if result.get('cache_hit') or not result.get('cache_image'):
+            return result
+
+        provisioner_name = ProvisionerProfile().search(group[0])
+        if not provisioner_name:
+            raise ProjectError("No provisioner matches configuration")
+        provisioner = ProvisionerProfile().get(provisioner_name)
+        if not provisioner.commit:
+            return result
+
+        result_list = self._node_results([result], password)
+        self._upload(group, provisioner_name, result_list, runner)
+        self._provision_default(group, provisioner_name, result_list, runner)
+        p_set = provisioner.parameter_gen(result_list[0], group[0].as_dict)
+        if runner.foreground(provisioner.driver, provisioner.module, provisioner.commit, p_set) != 0:
+            raise ProjectError(f"Can not save image {result['cache_image']}")
+        return dict(result, prepared=True)
+
     def _deploy_node(self, group, password, private_key, ca_cert, skip_provision=False):
         number = 0
-        runner = JobDispatch()
+        runner = JobDispatch(self.group_size(group))
+        node_list = []
 
         for db in group:
             cloud = db.get('cloud')
@@ -203,26 +309,21 @@ class Project(object):
             quantity = db['quantity'] if db['quantity'] else 1
             for n in range(int(quantity)):
                 number += 1
-                logger.info(f"Deploying service {db.get('name')} node group {db.get('group')} node {number}")
                 parameters = db.as_dict
                 parameters['number'] = number
-                runner.dispatch(module, instance, method, parameters)
-        result_list = list(runner.join())
+                node_list.append((module, instance, method, parameters))
+
+        result_list = []
+        if group[0].get('image_cache') and not skip_provision:
+            result_list.append(self._deploy_cache_node(group, node_list.pop(0), password))
+
+        for module, instance, method, parameters in node_list:
+            logger.info(f"Deploying service {parameters.get('name')} node group {parameters.get('group')} node {parameters['number']}")
+            runner.dispatch(module, instance, method, parameters)
+        result_list.extend(runner.join())
         if len(result_list) != number:
             raise ProjectError(f"Partial deployment: deployed {len(result_list)} expected {number}")
-        result_list = sorted(result_list, key=lambda d: d['name'])
-        private_ip_list = [d['private_ip'] for d in result_list]
-        public_ip_list = [d['public_ip'] for d in result_list]
-        private_host_list = [d['private_hostname'] for d in result_list if d.get('private_hostname')]
-        public_host_list = [d['public_hostname'] for d in result_list if d.get('public_hostname')]
-        service_list = [d['services'] for d in result_list if d.get('services', 'default')]
-        result_list = [dict(item,
-                            private_ip_list=private_ip_list,
-                            public_ip_list=public_ip_list,
-                            private_host_list=private_host_list,
-                            public_host_list=public_host_list,
-                            service_list=service_list) for item in result_list]
-        result_list = [dict(item, password=password) if 'password' not in item else item for item in result_list]
+        result_list = self._node_results(result_list, password)
 
         if skip_provision:
             return
@@ -242,36 +343,10 @@ class Project(object):
 
         logger.info(f"Selected provisioner {provisioner_name}")
 
-        if group[0].get('upload'):
-            provisioner = ProvisionerProfile().get(provisioner_name)
-            p_module = provisioner.driver
-            p_instance = provisioner.module
-            p_upload = provisioner.upload
-            p_list = [provisioner.parameter_gen(result, group[0].as_dict) for result in result_list]
-            for p_set in p_list:
-                logger.info(f"Uploading file {p_set.get('upload')}")
-                runner.dispatch(p_module, p_instance, p_upload, p_set)
-            exit_codes = list(runner.join())
-            if any(n != 0 for n in exit_codes):
-                raise ProjectError(f"Provisioning step failed")
+        self._upload(group, provisioner_name, [result for result in result_list if not result.get('prepared')], runner)
 
-        default_seq = BuildProfile().get('default')
-
-        for build_config in default_seq.get(provisioner_name):
-            if group[0].get('os_id') in build_config.exclude:
-                continue
-            provisioner = ProvisionerProfile().get(build_config.provisioner)
-            p_module = provisioner.driver
-            p_instance = provisioner.module
-            p_method = provisioner.method
-            p_list = [provisioner.parameter_gen(result, group[0].as_dict) for result in result_list]
-            for step, command in enumerate(build_config.commands):
-                for p_set in p_list:
-                    logger.info(f"Provisioning node {p_set.get('name')} - default step #{step + 1}")
-                    runner.dispatch(p_module, p_instance, p_method, p_set, command, build_config.root)
-                exit_codes = list(runner.join())
-                if any(n != 0 for n in exit_codes):
-                    raise ProjectError(f"Provisioning step failed")
+        prep_list = [result for result in result_list if not result.get('cache_hit') and not result.get('prepared')]
+        self._provision_default(group, provisioner_name, prep_list, runner)
 
         build_seq = BuildProfile().get(group[0].get('build'))
 
@@ -306,7 +381,7 @@ class Project(object):
 
     def _destroy_node(self, group):
         number = 0
-        runner = JobDispatch()
+        runner = JobDispatch(self.group_size(group))
 
         for db in group:
             cloud = db.get('cloud')
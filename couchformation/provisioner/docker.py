@@ -49,6 +49,7 @@ class ContainerExec(object):
             else self.parameters.get('connect')
         self.private_ip_list = ','.join(self.parameters.get('private_ip_list'))
         self.use_private_ip = self.parameters.get('use_private_ip') if self.parameters.get('use_private_ip') else False
+        self.cache_image = self.parameters.get('cache_image')
 
     def upload(self):
         Container(self.parameters).copy_file_to_container(self.container_name, self.upload_file, "/var/tmp")
@@ -56,6 +57,13 @@ class ContainerExec(object):
     def copy_file(self, fl, target):
         Container(self.parameters).copy_io_to_container(self.container_name, fl, target)
 
+    def commit(self):
+        if not self.cache_image:
+            return 0
+        logger.info(f"Saving {self.container_name} as image {self.cache_image}")
+        Container(self.parameters).commit(self.container_name, self.cache_image)
+        return 0
+
     def run(self):
         working_dir = get_state_dir(self.project, self.service)
         file_output = logging.getLogger('couchformation.provisioner.output')
@@ -75,16 +83,13 @@ class ContainerExec(object):
 
         file_output.info(f"{self.container_name}: [{_command}] begins")
 
-        exit_code, output = Container(self.parameters).run_in_container(self.container_name, _command, root=self.root)
-
-        for line in output.readlines():
-            if not line:
-                break
-            line_out = line.decode("utf-8").strip()
-            log_out = f"{self.container_name}: {line_out}"
+        def output(line_out: str, _source: str):
+            log_out = f"{self.container_name}: {line_out.strip()}"
             logger.info(log_out)
             file_output.info(log_out)
 
+        exit_code = Container(self.parameters).stream_in_container(self.container_name, _command, output, root=self.root)
+
         file_output.info(f"{self.container_name}: [{_command}] complete")
 
         logger.info(f"Command complete for {self.container_name}")
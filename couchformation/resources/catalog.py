@@ -0,0 +1,63 @@
+##
+##
+
+import logging
+import os
+import json
+import time
+from typing import Any, Union
+import couchformation.constants as C
+from couchformation.config import get_root_dir
+from couchformation.exception import FatalError
+from couchformation.util import FileManager
+from couchformation.kvdb import KeyValueStore, documents
+
+logger = logging.getLogger('couchformation.resources.catalog')
+logger.addHandler(logging.NullHandler())
+
+
+class CatalogError(FatalError):
+    pass
+
+
+class CatalogManager(object):
+
+    def __init__(self, cloud: str, ttl: int = C.CATALOG_TTL):
+        self.filename = C.CATALOG_FILE
+        self.cloud = cloud
+        self.ttl = ttl
+
+        try:
+            if not os.path.exists(get_root_dir()):
+                FileManager().make_dir(get_root_dir())
+        except Exception as err:
+            raise CatalogError(f"can not create root dir: {err}")
+
+    def get(self, key: str) -> Union[Any, None]:
+        table = KeyValueStore(self.filename, self.cloud)
+        entry = table.get(key)
+        if not entry:
+            return None
+        try:
+            entry = json.loads(entry)
+        except ValueError:
+            return None
+        if time.time() - entry.get('timestamp', 0) > self.ttl:
+            logger.debug(f"Catalog entry {self.cloud}:{key} expired")
+            return None
+        return entry.get('data')
+
+    def set(self, key: str, value: Any):
+        table = KeyValueStore(self.filename, self.cloud)
+        table[key] = json.dumps({'timestamp': time.time(), 'data': value})
+
+    def reset(self):
+        table = KeyValueStore(self.filename, self.cloud)
+        table.clear()
+
+    @staticmethod
+    def reset_all():
+        if not os.path.exists(C.CATALOG_FILE):
+            return
+        for table in documents(C.CATALOG_FILE):
+            table.clear()
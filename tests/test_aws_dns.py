@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import warnings
+import unittest
+from unittest import mock
+import botocore.exceptions
+
+warnings.filterwarnings("ignore")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+sys.path.append(current)
+
+from couchformation.aws.driver.dns import DNS
+
+
+def client_error(code, message):
+    return botocore.exceptions.ClientError({'Error': {'Code': code, 'Message': message}}, 'ChangeResourceRecordSets')
+
+
+class TestAWSDNS(unittest.TestCase):
+
+    def setUp(self):
+        self.dns = DNS.__new__(DNS)
+        self.dns.dns_client = mock.Mock()
+        DNS._zone_cache.clear()
+
+    @staticmethod
+    def batch_names(call):
+        return [change['ResourceRecordSet']['Name'] for change in call.kwargs['ChangeBatch']['Changes']]
+
+    def test_add_records(self):
+        self.dns.dns_client.change_resource_record_sets.return_value = {'ChangeInfo': {'Status': 'PENDING'}}
+        records = [('node-01.example.com', ['10.0.0.1']), ('node-02.example.com', ['10.0.0.2'])]
+
+        status = self.dns.add_records('Z1', records)
+
+        self.assertEqual(status, 'PENDING')
+        self.assertEqual(self.dns.dns_client.change_resource_record_sets.call_count, 1)
+        call = self.dns.dns_client.change_resource_record_sets.call_args
+        self.assertEqual(self.batch_names(call), ['node-01.example.com', 'node-02.example.com'])
+        self.assertEqual({change['Action'] for change in call.kwargs['ChangeBatch']['Changes']}, {'CREATE'})
+
+    def test_delete_records(self):
+        self.dns.dns_client.change_resource_record_sets.return_value = {'ChangeInfo': {'Status': 'PENDING'}}
+        records = [('node-01.example.com', ['10.0.0.1']), ('node-02.example.com', ['10.0.0.2'])]
+
+        self.dns.delete_records('Z1', records)
+
+        self.assertEqual(self.dns.dns_client.change_resource_record_sets.call_count, 1)
+
+    def test_delete_records_missing(self):
+        missing = client_error('InvalidChangeBatch', "Tried to delete resource record set [name='node-02.example.com.', type='A'] but it was not found")
+
+        def change(HostedZoneId, ChangeBatch):
+            names = [c['ResourceRecordSet']['Name'] for c in ChangeBatch['Changes']]
+            if 'node-02.example.com' in names:
+                raise missing
+            return {'ChangeInfo': {'Status': 'PENDING'}}
+
+        self.dns.dns_client.change_resource_record_sets.side_effect = change
+        records = [('node-01.example.com', ['10.0.0.1']), ('node-02.example.com', ['10.0.0.2']), ('node-03.example.com', ['10.0.0.3'])]
+
+        self.dns.delete_records('Z1', records)
+
+        calls = self.dns.dns_client.change_resource_record_sets.call_args_list
+        self.assertEqual(len(calls), 4)
+        self.assertEqual([self.batch_names(call) for call in calls[1:]], [['node-01.example.com'], ['node-02.example.com'], ['node-03.example.com']])
+
+    def test_delete_records_mismatch(self):
+        self.dns.dns_client.change_resource_record_sets.side_effect = client_error('InvalidChangeBatch', "the values provided do not match the current values")
+
+        with self.assertRaises(SystemExit):
+            self.dns.delete_records('Z1', [('node-01.example.com', ['10.0.0.1'])])
+
+    def test_zone_id_cache(self):
+        self.dns.dns_client.list_hosted_zones.return_value = {'HostedZones': []}
+        self.assertIsNone(self.dns.zone_id('example.com'))
+
+        self.dns.dns_client.list_hosted_zones.return_value = {'HostedZones': [{'Name': 'example.com.', 'Id': 'Z1', 'Config': {'PrivateZone': False}}]}
+        self.assertEqual(self.dns.zone_id('example.com'), 'Z1')
+        self.assertEqual(self.dns.zone_id('example.com'), 'Z1')
+        self.assertEqual(self.dns.dns_client.list_hosted_zones.call_count, 2)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import threading
+import warnings
+import unittest
+from unittest import mock
+
+warnings.filterwarnings("ignore")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+sys.path.append(current)
+
+from couchformation.aws.driver.base import AWSDriverError
+from couchformation.aws.driver.instance import InstanceWatcher
+
+
+class TestInstanceWatcher(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('couchformation.aws.driver.instance.Instance')
+        self.instance = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.driver = self.instance.return_value
+        self.watcher = InstanceWatcher({'region': 'us-east-2'}, interval=0.01, max_errors=2, timeout=5.0)
+
+    def wait_all(self, instance_ids):
+        results = {}
+        errors = {}
+
+        def wait(instance_id):
+            try:
+                results[instance_id] = self.watcher.wait_for(instance_id, lambda i: i['State']['Name'] == 'running')
+            except BaseException as err:
+                errors[instance_id] = err
+
+        threads = [threading.Thread(target=wait, args=(instance_id,)) for instance_id in instance_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        return results, errors
+
+    def test_wait_for(self):
+        self.driver.list_by_id.side_effect = lambda ids: [{'InstanceId': i, 'State': {'Name': 'running'}} for i in ids]
+
+        results, errors = self.wait_all(['i-1', 'i-2'])
+
+        self.assertEqual(errors, {})
+        self.assertEqual(sorted(results), ['i-1', 'i-2'])
+
+    def test_fatal_poll_error(self):
+        def list_by_id(ids):
+            raise AWSDriverError("error getting instance list: denied")
+
+        self.driver.list_by_id.side_effect = list_by_id
+
+        results, errors = self.wait_all(['i-1', 'i-2'])
+
+        self.assertEqual(results, {})
+        self.assertEqual(len(errors), 2)
+        for err in errors.values():
+            self.assertIsInstance(err, SystemExit)
+        self.assertIsNone(self.watcher.thread)
+        self.assertEqual(self.watcher.pending, {})
+
+    def test_poll_error_limit(self):
+        self.driver.list_by_id.side_effect = ValueError("throttled")
+
+        results, errors = self.wait_all(['i-1'])
+
+        self.assertEqual(results, {})
+        self.assertIsInstance(errors['i-1'], SystemExit)
+        self.assertEqual(self.driver.list_by_id.call_count, 2)
+
+    def test_wait_timeout(self):
+        self.watcher.timeout = 0.2
+        self.driver.list_by_id.side_effect = lambda ids: [{'InstanceId': i, 'State': {'Name': 'pending'}} for i in ids]
+
+        results, errors = self.wait_all(['i-1'])
+
+        self.assertEqual(results, {})
+        self.assertIsInstance(errors['i-1'], SystemExit)
+        self.assertEqual(self.watcher.pending, {})
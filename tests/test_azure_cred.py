@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import time
+import warnings
+import unittest
+from unittest import mock
+from azure.core.credentials import AccessToken, AccessTokenInfo
+
+warnings.filterwarnings("ignore")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+sys.path.append(current)
+
+from couchformation.azure.driver.base import CachedCredential
+
+SCOPE = 'https://management.azure.com/.default'
+
+
+class TestCachedCredential(unittest.TestCase):
+
+    def setUp(self):
+        self.source = mock.Mock()
+        self.source.tenant_id = 'tenant'
+        self.credential = CachedCredential(self.source)
+
+    def test_get_token_cached(self):
+        self.source.get_token.return_value = AccessToken('token-1', int(time.time()) + 3600)
+
+        first = self.credential.get_token(SCOPE)
+        second = self.credential.get_token(SCOPE)
+
+        self.assertEqual(first.token, 'token-1')
+        self.assertIs(first, second)
+        self.assertEqual(self.source.get_token.call_count, 1)
+        self.assertEqual(self.credential.tenant_id, 'tenant')
+
+    def test_get_token_refresh(self):
+        self.source.get_token.side_effect = [
+            AccessToken('token-1', int(time.time()) + 60),
+            AccessToken('token-2', int(time.time()) + 3600)
+        ]
+
+        self.assertEqual(self.credential.get_token(SCOPE).token, 'token-1')
+        self.assertEqual(self.credential.get_token(SCOPE).token, 'token-2')
+        self.assertEqual(self.credential.get_token(SCOPE).token, 'token-2')
+        self.assertEqual(self.source.get_token.call_count, 2)
+
+    def test_get_token_claims(self):
+        self.source.get_token.return_value = AccessToken('token-1', int(time.time()) + 3600)
+
+        self.credential.get_token(SCOPE, claims='challenge')
+        self.credential.get_token(SCOPE, claims='challenge')
+
+        self.assertEqual(self.source.get_token.call_count, 2)
+
+    def test_get_token_info_cached(self):
+        self.source.get_token_info.side_effect = [
+            AccessTokenInfo('info-1', int(time.time()) + 60),
+            AccessTokenInfo('info-2', int(time.time()) + 3600)
+        ]
+
+        self.assertEqual(self.credential.get_token_info(SCOPE).token, 'info-1')
+        self.assertEqual(self.credential.get_token_info(SCOPE).token, 'info-2')
+        self.assertEqual(self.credential.get_token_info(SCOPE, options={}).token, 'info-2')
+        self.assertEqual(self.source.get_token_info.call_count, 2)
+        self.source.get_token.assert_not_called()
+
+    def test_get_token_info_fallback(self):
+        source = mock.Mock(spec=['get_token'])
+        source.get_token.return_value = AccessToken('token-1', int(time.time()) + 3600)
+        credential = CachedCredential(source)
+
+        self.assertEqual(credential.get_token_info(SCOPE).token, 'token-1')
+        self.assertEqual(credential.get_token_info(SCOPE).token, 'token-1')
+        self.assertEqual(source.get_token.call_count, 1)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import threading
+import warnings
+import unittest
+
+warnings.filterwarnings("ignore")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+sys.path.append(current)
+
+from couchformation.executor.batch import BatchRequest, BatchError
+
+
+class TestBatchRequest(unittest.TestCase):
+
+    @staticmethod
+    def submit_all(key, items, handler, expected, window=5.0):
+        results = {}
+        errors = {}
+
+        def submit(item):
+            try:
+                results[item] = BatchRequest.submit(key, item, handler, expected=expected, window=window)
+            except BaseException as err:
+                errors[item] = err
+
+        threads = [threading.Thread(target=submit, args=(item,)) for item in items]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        return results, errors
+
+    def test_leader_follower(self):
+        calls = []
+
+        def handler(items):
+            calls.append(list(items))
+            return [item * 10 for item in items]
+
+        results, errors = self.submit_all('leader', [1, 2, 3], handler, expected=3)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(calls[0]), [1, 2, 3])
+        self.assertEqual(results, {1: 10, 2: 20, 3: 30})
+        self.assertEqual(errors, {})
+
+    def test_window_timeout(self):
+        calls = []
+
+        def handler(items):
+            calls.append(list(items))
+            return items
+
+        results, errors = self.submit_all('timeout', [1, 2], handler, expected=3, window=0.2)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(calls[0]), [1, 2])
+        self.assertEqual(results, {1: 1, 2: 2})
+
+    def test_handler_error(self):
+        def handler(items):
+            raise ValueError("handler failed")
+
+        results, errors = self.submit_all('error', [1, 2, 3], handler, expected=3)
+
+        self.assertEqual(results, {})
+        self.assertEqual(len(errors), 3)
+        for err in errors.values():
+            self.assertIsInstance(err, SystemExit)
+        self.assertEqual(len(set(id(err) for err in errors.values())), 3)
+
+    def test_handler_fatal_error(self):
+        def handler(items):
+            raise BatchError("driver failed")
+
+        results, errors = self.submit_all('fatal', [1, 2, 3], handler, expected=3)
+
+        self.assertEqual(results, {})
+        self.assertEqual(len(errors), 3)
+        for err in errors.values():
+            self.assertIsInstance(err, SystemExit)
+
+    def test_result_count_mismatch(self):
+        results, errors = self.submit_all('mismatch', [1, 2], lambda items: items[:1], expected=2)
+
+        self.assertEqual(results, {})
+        self.assertEqual(len(errors), 2)
+
+    def test_key_reuse(self):
+        first, _ = self.submit_all('reuse', [1], lambda items: items, expected=1)
+        second, _ = self.submit_all('reuse', [2], lambda items: items, expected=1)
+
+        self.assertEqual(first, {1: 1})
+        self.assertEqual(second, {2: 2})
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import time
+import warnings
+import unittest
+from unittest import mock
+
+warnings.filterwarnings("ignore")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+sys.path.append(current)
+
+import couchformation.constants as C
+from couchformation.resources.catalog import CatalogManager
+
+
+def create_path(filename):
+    filename = os.path.join(current, "db", filename)
+    dirname = os.path.dirname(filename)
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+    return filename
+
+
+class TestCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.filename = create_path("catalog_test.db")
+        os.unlink(self.filename) if os.path.exists(self.filename) else True
+        self.patch = mock.patch.object(C, 'CATALOG_FILE', self.filename)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        os.unlink(self.filename) if os.path.exists(self.filename) else True
+
+    def test_get_set(self):
+        catalog = CatalogManager('gcp')
+        self.assertIsNone(catalog.get('image:debian'))
+        catalog.set('image:debian', {'name': 'debian-12'})
+        self.assertEqual(catalog.get('image:debian'), {'name': 'debian-12'})
+        self.assertIsNone(CatalogManager('aws').get('image:debian'))
+
+    def test_ttl(self):
+        catalog = CatalogManager('gcp', ttl=60)
+        catalog.set('machine:4x16', ['n2-standard-4'])
+        now = time.time()
+        with mock.patch('couchformation.resources.catalog.time.time', return_value=now + 30):
+            self.assertEqual(catalog.get('machine:4x16'), ['n2-standard-4'])
+        with mock.patch('couchformation.resources.catalog.time.time', return_value=now + 61):
+            self.assertIsNone(catalog.get('machine:4x16'))
+
+    def test_reset(self):
+        CatalogManager('gcp').set('key', 1)
+        CatalogManager('aws').set('key', 2)
+
+        CatalogManager('gcp').reset()
+        self.assertIsNone(CatalogManager('gcp').get('key'))
+        self.assertEqual(CatalogManager('aws').get('key'), 2)
+
+        CatalogManager.reset_all()
+        self.assertIsNone(CatalogManager('aws').get('key'))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import queue
+import time
+import warnings
+import unittest
+from unittest import mock
+import docker
+
+warnings.filterwarnings("ignore")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+sys.path.append(current)
+
+from couchformation.docker.driver.base import ContainerCache
+
+
+class EventStream(object):
+
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def __iter__(self):
+        while True:
+            event = self.queue.get()
+            if isinstance(event, Exception):
+                raise event
+            if event is None:
+                return
+            yield event
+
+    def send(self, event):
+        self.queue.put(event)
+
+
+def container(name, container_id):
+    item = mock.Mock()
+    item.name = name
+    item.id = container_id
+    return item
+
+
+def wait_for(condition, timeout=5.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestContainerCache(unittest.TestCase):
+
+    def setUp(self):
+        self.streams = []
+        self.client = mock.Mock()
+        self.client.events.side_effect = self.open_stream
+        self.client.containers.get.side_effect = lambda name: container(name, f"id-{name}")
+        self.cache = ContainerCache(self.client)
+        self.cache.backoff_initial = 0.05
+
+    def tearDown(self):
+        self.cache.stop()
+        for stream in self.streams:
+            stream.send(None)
+        self.cache.watcher.join(5)
+
+    def open_stream(self, **kwargs):
+        stream = EventStream()
+        self.streams.append(stream)
+        return stream
+
+    def test_cached_get(self):
+        self.cache.get('node-01')
+        self.assertTrue(wait_for(lambda: self.cache.connected))
+
+        first = self.cache.get('node-01')
+        second = self.cache.get('node-01')
+
+        self.assertIs(first, second)
+        self.assertEqual(self.client.events.call_count, 1)
+
+    def test_event_invalidation(self):
+        self.cache.get('node-01')
+        self.assertTrue(wait_for(lambda: self.cache.connected))
+        first = self.cache.get('node-01')
+
+        self.streams[0].send({'Type': 'container', 'Actor': {'ID': first.id, 'Attributes': {'name': 'node-01'}}})
+        self.assertTrue(wait_for(lambda: 'node-01' not in self.cache.entries))
+
+        self.assertIsNot(self.cache.get('node-01'), first)
+
+    def test_network_event_invalidation(self):
+        self.cache.get('node-01')
+        self.assertTrue(wait_for(lambda: self.cache.connected))
+        first = self.cache.get('node-01')
+
+        self.streams[0].send({'Type': 'network', 'Actor': {'ID': 'net-01', 'Attributes': {'container': first.id}}})
+        self.assertTrue(wait_for(lambda: 'node-01' not in self.cache.entries))
+
+    def test_not_found(self):
+        self.client.containers.get.side_effect = docker.errors.NotFound('missing')
+        self.assertIsNone(self.cache.get('node-01'))
+
+    def test_reconnect(self):
+        self.cache.get('node-01')
+        self.assertTrue(wait_for(lambda: self.cache.connected))
+        self.cache.get('node-01')
+
+        self.streams[0].send(ConnectionError("stream closed"))
+        self.assertTrue(wait_for(lambda: len(self.streams) == 2 and self.cache.connected))
+
+        self.assertEqual(self.cache.entries, {})
+        self.assertIsNotNone(self.cache.watcher)
+        self.assertTrue(self.cache.watcher.is_alive())
+
+    def test_direct_inspect_while_down(self):
+        self.client.events.side_effect = ConnectionError("daemon unavailable")
+        self.cache.backoff_initial = 10.0
+
+        first = self.cache.get('node-01')
+        self.assertTrue(wait_for(lambda: self.client.events.call_count == 1))
+        second = self.cache.get('node-01')
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.client.containers.get.call_count, 2)
+        self.assertEqual(self.cache.entries, {})
+        self.assertEqual(self.client.events.call_count, 1)
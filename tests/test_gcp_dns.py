@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import warnings
+import unittest
+from unittest import mock
+
+warnings.filterwarnings("ignore")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+sys.path.append(current)
+
+from couchformation.gcp.driver.dns import DNS
+
+
+class TestGCPDNS(unittest.TestCase):
+
+    def setUp(self):
+        self.dns = DNS.__new__(DNS)
+        self.dns.gcp_project = 'pytest'
+        self.dns.dns_client = mock.Mock()
+        self.rrsets = []
+        record_sets = self.dns.dns_client.resourceRecordSets.return_value
+        record_sets.list.return_value.execute.side_effect = lambda: {'rrsets': self.rrsets}
+        record_sets.list_next.return_value = None
+
+    def change_body(self):
+        self.assertEqual(self.dns.dns_client.changes.return_value.create.call_count, 1)
+        return self.dns.dns_client.changes.return_value.create.call_args.kwargs['body']
+
+    def test_add_records(self):
+        records = [('node-01.example.com', ['10.0.0.1']), ('node-02.example.com', ['10.0.0.2'])]
+
+        self.dns.add_records('example-zone', records)
+
+        body = self.change_body()
+        self.assertEqual([r['name'] for r in body['additions']], ['node-01.example.com.', 'node-02.example.com.'])
+        self.assertEqual([r['rrdatas'] for r in body['additions']], [['10.0.0.1'], ['10.0.0.2']])
+
+    def test_delete_records(self):
+        self.rrsets = [
+            {'name': 'node-01.example.com.', 'type': 'A', 'ttl': 300, 'rrdatas': ['10.0.0.1']},
+            {'name': 'node-02.example.com.', 'type': 'A', 'ttl': 60, 'rrdatas': ['10.0.0.9']},
+            {'name': 'example.com.', 'type': 'NS', 'ttl': 300, 'rrdatas': ['ns1.example.com.']}
+        ]
+        records = [('node-01.example.com', ['10.0.0.1']), ('node-02.example.com', ['10.0.0.2'])]
+
+        self.dns.delete_records('example-zone', records)
+
+        body = self.change_body()
+        self.assertEqual(body['deletions'], self.rrsets[:2])
+
+    def test_delete_records_missing(self):
+        self.rrsets = [
+            {'name': 'node-02.example.com.', 'type': 'A', 'ttl': 300, 'rrdatas': ['10.0.0.2']}
+        ]
+        records = [('node-01.example.com', ['10.0.0.1']), ('node-02.example.com', ['10.0.0.2'])]
+
+        with self.assertLogs('couchformation.gcp.driver.dns', level='WARNING') as log:
+            self.dns.delete_records('example-zone', records)
+
+        self.assertIn('node-01.example.com', log.output[0])
+        body = self.change_body()
+        self.assertEqual([r['name'] for r in body['deletions']], ['node-02.example.com.'])
+
+    def test_delete_records_none_present(self):
+        with self.assertLogs('couchformation.gcp.driver.dns', level='WARNING'):
+            self.dns.delete_records('example-zone', [('node-01.example.com', ['10.0.0.1'])])
+
+        self.dns.dns_client.changes.return_value.create.assert_not_called()
+
+    def test_delete_records_error(self):
+        self.rrsets = [{'name': 'node-01.example.com.', 'type': 'A', 'ttl': 300, 'rrdatas': ['10.0.0.1']}]
+        self.dns.dns_client.changes.return_value.create.return_value.execute.side_effect = Exception("conflict")
+
+        with self.assertRaises(SystemExit):
+            self.dns.delete_records('example-zone', [('node-01.example.com', ['10.0.0.1'])])
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import socket
+import warnings
+import unittest
+from unittest import mock
+import httplib2
+import googleapiclient.errors
+
+warnings.filterwarnings("ignore")
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+sys.path.append(current)
+
+from couchformation.gcp.driver.base import CloudBase
+from couchformation.gcp.driver.instance import Instance
+
+
+def http_error(status):
+    return googleapiclient.errors.HttpError(httplib2.Response({'status': status}), b'{}')
+
+
+class TestGCPOperations(unittest.TestCase):
+
+    def setUp(self):
+        self.base = CloudBase.__new__(CloudBase)
+        self.base.gcp_project = 'pytest'
+        self.base.gcp_client = mock.Mock()
+        self.calls = []
+        self.status = {}
+        self.base.operation_request = self.operation_request
+
+    def operation_request(self, operation, method, zone=None, region=None):
+        request = mock.Mock()
+
+        def execute():
+            self.calls.append((operation, method))
+            status = self.status[operation]
+            if isinstance(status, BaseException):
+                raise status
+            return {'name': operation, 'status': status.pop(0) if isinstance(status, list) else status}
+
+        request.execute.side_effect = execute
+        return request
+
+    def test_wait_for_operations(self):
+        self.status = {'op-1': ['RUNNING', 'DONE'], 'op-2': 'DONE', 'op-3': ['RUNNING', 'DONE']}
+        operations = [{'name': 'op-1'}, {'name': 'op-2', 'zone': 'zones/us-central1-a'}, {'name': 'op-3'}]
+
+        results = self.base.wait_for_operations(operations)
+
+        self.assertEqual([r['name'] for r in results], ['op-1', 'op-2', 'op-3'])
+        self.assertEqual(self.calls, [('op-1', 'wait'), ('op-2', 'get'), ('op-3', 'get'), ('op-1', 'wait'), ('op-3', 'get')])
+
+    def test_wait_for_operations_timeout(self):
+        statuses = [socket.timeout(), 'DONE']
+
+        def execute():
+            status = statuses.pop(0)
+            if isinstance(status, BaseException):
+                raise status
+            return {'name': 'op-1', 'status': status}
+
+        self.base.operation_request = lambda *args, **kwargs: mock.Mock(execute=mock.Mock(side_effect=execute))
+
+        results = self.base.wait_for_operations([{'name': 'op-1'}])
+
+        self.assertEqual(results[0]['status'], 'DONE')
+
+    def test_wait_for_operations_http_error(self):
+        self.status = {'op-1': http_error(403)}
+
+        with self.assertRaises(SystemExit):
+            self.base.wait_for_operations([{'name': 'op-1'}])
+
+    def test_wait_for_operation_http_error(self):
+        self.status = {'op-1': http_error(500)}
+
+        with self.assertRaises(SystemExit):
+            self.base.wait_for_operation({'name': 'op-1', 'region': 'regions/us-central1'})
+
+
+class TestGCPInstance(unittest.TestCase):
+
+    def test_name_filter(self):
+        self.assertEqual(Instance.name_filter(['cbs-node-01', 'cbs-node-02']), 'name eq "^(cbs\\-node\\-01|cbs\\-node\\-02)$"')
+        self.assertEqual(Instance.name_filter(['node.1']), 'name eq "^(node\\.1)$"')
+
+    def test_list_by_name(self):
+        instance = Instance.__new__(Instance)
+        instance.gcp_project = 'pytest'
+        instance.gcp_client = mock.Mock()
+        instances = instance.gcp_client.instances.return_value
+        instances.list.return_value.execute.return_value = {'items': [{'name': 'cbs-node-01'}]}
+        instances.list_next.return_value = None
+
+        self.assertEqual(instance.list_by_name(['cbs-node-01'], 'us-central1-a'), [{'name': 'cbs-node-01'}])
+        instances.list.assert_called_once_with(project='pytest', filter='name eq "^(cbs\\-node\\-01)$"', zone='us-central1-a')